@@ -7,6 +7,10 @@ Owner: Modupe Adegoke Akanni
 
 import sqlite3
 import os
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 
 
@@ -15,6 +19,42 @@ DB_DIR = "data"
 DB_NAME = "agri_jobs.db"
 DB_PATH = os.path.join(DB_DIR, DB_NAME)
 
+# Connection tuning. journal_mode is persisted in the database file, so it only
+# needs to be switched once per DB_PATH; the remaining pragmas are per-connection.
+BUSY_TIMEOUT_MS = 5000
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+_pragmas_applied = set()
+
+# Durability off, for throwaway databases such as the test suites': the journal
+# is kept in memory and commits never fsync, so a crash can corrupt the file.
+# Enabled with AGRI_TEST_FAST=1 or by setting FAST_UNSAFE_PRAGMAS directly.
+FAST_UNSAFE_PRAGMAS = os.environ.get("AGRI_TEST_FAST") == "1"
+_FAST_UNSAFE_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+)
+
+# Maximum number of idle connections kept open for reuse
+POOL_SIZE = 4
+
+# Prepared statements kept per connection by sqlite3's LRU statement cache.
+# Pooled connections live for the whole process, so sizing this above the
+# number of distinct statements the application issues keeps every hot
+# statement prepared for the connection's lifetime.
+STATEMENT_CACHE_SIZE = 256
+
+# Version of the schema created by init_database(), stored in PRAGMA user_version.
+# Bump it whenever the tables, indexes or triggers below change so existing
+# databases re-run the (idempotent) schema setup.
+SCHEMA_VERSION = 3
+
+# Tables whose writes bump their counter in data_versions (see table_version())
+VERSIONED_TABLES = ("workers", "jobs")
+
 
 def init_database():
     """
@@ -26,6 +66,9 @@ def init_database():
     - jobs: Job postings
     - matches: Job-worker match results
     
+    along with indexes on the job columns used for filtering and searching.
+    Databases already at SCHEMA_VERSION skip the schema setup entirely.
+    
     Returns:
         bool: True if successful, False otherwise
     """
@@ -38,64 +81,147 @@ def init_database():
         conn = get_connection()
         cursor = conn.cursor()
         
-        # Create farmers table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS farmers (
-                farmer_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                phone TEXT NOT NULL,
-                location TEXT NOT NULL,
-                email TEXT,
-                registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create workers table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS workers (
-                worker_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                phone TEXT NOT NULL,
-                location TEXT NOT NULL,
-                skills TEXT NOT NULL,
-                available BOOLEAN DEFAULT 1,
-                registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create jobs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                job_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                farmer_id INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                skill_required TEXT NOT NULL,
-                location TEXT NOT NULL,
-                duration TEXT,
-                pay_rate TEXT,
-                status TEXT DEFAULT 'open',
-                posted_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (farmer_id) REFERENCES farmers(farmer_id)
-            )
-        """)
-        
-        # Create matches table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS matches (
-                match_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER NOT NULL,
-                worker_id INTEGER NOT NULL,
-                match_score INTEGER,
-                match_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (job_id) REFERENCES jobs(job_id),
-                FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
-            )
-        """)
-        
-        # Commit changes
-        conn.commit()
-        conn.close()
+        # One pragma read instead of replaying every CREATE ... IF NOT EXISTS
+        if cursor.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return_connection(conn)
+            return True
+        
+        # One transaction for the whole schema: sqlite3 does not open one
+        # before DDL, so each CREATE would otherwise commit on its own. The
+        # version is stamped in the same transaction, so a failed setup is
+        # retried in full on the next start.
+        cursor.execute("BEGIN")
+        try:
+            # Create farmers table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS farmers (
+                    farmer_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    phone TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    email TEXT,
+                    registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Create workers table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS workers (
+                    worker_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    phone TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    skills TEXT NOT NULL,
+                    available BOOLEAN DEFAULT 1,
+                    registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Create jobs table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    farmer_id INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    description TEXT,
+                    skill_required TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    duration TEXT,
+                    pay_rate TEXT,
+                    status TEXT DEFAULT 'open',
+                    posted_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (farmer_id) REFERENCES farmers(farmer_id)
+                )
+            """)
+            
+            # Create matches table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS matches (
+                    match_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id INTEGER NOT NULL,
+                    worker_id INTEGER NOT NULL,
+                    match_score INTEGER,
+                    match_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (job_id) REFERENCES jobs(job_id),
+                    FOREIGN KEY (worker_id) REFERENCES workers(worker_id)
+                )
+            """)
+            
+            # Indexes for the job board's filters and lookups. The NOCASE indexes
+            # match LIKE's case-insensitive comparison, so prefix searches can seek.
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_farmer ON jobs(farmer_id)")
+            # (status, farmer_id) also serves status-only filters, replacing idx_jobs_status
+            cursor.execute("DROP INDEX IF EXISTS idx_jobs_status")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_farmer ON jobs(status, farmer_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_workers_available ON workers(available)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_location_nocase ON jobs(location COLLATE NOCASE)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_skill_nocase ON jobs(skill_required COLLATE NOCASE)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_job_worker ON matches(job_id, worker_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_worker ON matches(worker_id)")
+            
+            # Full-text index over the searchable job columns, kept in sync with the
+            # jobs table by triggers. It is rebuilt once when first added to an
+            # existing database so jobs posted before it are searchable too.
+            fts_exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+            ).fetchone()
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, skill_required, location, description,
+                    content='jobs', content_rowid='job_id',
+                    tokenize='porter unicode61'
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                    INSERT INTO jobs_fts (rowid, title, skill_required, location, description)
+                    VALUES (new.job_id, new.title, new.skill_required, new.location, new.description);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                    INSERT INTO jobs_fts (jobs_fts, rowid, title, skill_required, location, description)
+                    VALUES ('delete', old.job_id, old.title, old.skill_required, old.location, old.description);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE ON jobs BEGIN
+                    INSERT INTO jobs_fts (jobs_fts, rowid, title, skill_required, location, description)
+                    VALUES ('delete', old.job_id, old.title, old.skill_required, old.location, old.description);
+                    INSERT INTO jobs_fts (rowid, title, skill_required, location, description)
+                    VALUES (new.job_id, new.title, new.skill_required, new.location, new.description);
+                END
+            """)
+            if not fts_exists:
+                cursor.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+            
+            # Per-table change counters, bumped by triggers on every write so
+            # in-process caches can tell with one lookup whether a table changed.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS data_versions (
+                    name TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            for table in VERSIONED_TABLES:
+                cursor.execute("INSERT OR IGNORE INTO data_versions (name) VALUES (?)", (table,))
+                for event in ("INSERT", "UPDATE", "DELETE"):
+                    cursor.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()}
+                        AFTER {event} ON {table} BEGIN
+                            UPDATE data_versions SET version = version + 1 WHERE name = '{table}';
+                        END
+                    """)
+            
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            conn.close()
+            raise
+        # Refresh planner statistics for the new indexes where they are stale
+        cursor.execute("PRAGMA optimize")
+        return_connection(conn)
         
         print(f"Database initialized successfully at {DB_PATH}")
         return True
@@ -108,10 +234,159 @@ def init_database():
         return False
 
 
+class PooledConnection(sqlite3.Connection):
+    """
+    sqlite3 connection that keeps one cursor for the fetch helpers to reuse.
+    
+    fetch_all(), fetch_all_rows() and fetch_all_tuples() read every row before
+    returning, which leaves the cursor idle, so they can share a single cursor
+    per connection instead of allocating one per query. Helpers whose cursor
+    outlives the call (execute_query() returns it) or that stop reading early
+    (fetch_one()) keep using a private cursor.
+    """
+    
+    _shared_cursor = None
+    
+    def shared_cursor(self):
+        """
+        Return this connection's shared cursor, creating it on first use.
+        
+        Returns:
+            sqlite3.Cursor: Cursor reused by the fetch helpers
+        """
+        if self._shared_cursor is None:
+            self._shared_cursor = self.cursor()
+        return self._shared_cursor
+
+
+def _open_connection():
+    """
+    Open a new connection to DB_PATH with the standard pragmas applied.
+    
+    The connection runs in WAL journal mode with synchronous=NORMAL, so a
+    commit appends to the write-ahead log instead of fsyncing the rollback
+    journal and the database file, and readers do not block writers. With
+    FAST_UNSAFE_PRAGMAS set it journals in memory without syncing instead.
+    
+    Returns:
+        sqlite3.Connection: Database connection object
+    """
+    conn = sqlite3.connect(
+        DB_PATH,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        factory=PooledConnection,
+    )
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    
+    if FAST_UNSAFE_PRAGMAS:
+        # Not persisted like WAL, so applied to every connection
+        for pragma in CONNECTION_PRAGMAS + _FAST_UNSAFE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    if DB_PATH not in _pragmas_applied:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _pragmas_applied.add(DB_PATH)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class SQLiteConnectionPool:
+    """
+    Small LIFO pool of open connections to DB_PATH.
+    
+    Reusing a warm connection skips the file open, pragma setup and page cache
+    warm-up that a fresh sqlite3.connect() pays on every call. The pool only
+    holds connections for one database path and is drained when DB_PATH
+    changes (the tests point DB_PATH at temporary databases).
+    """
+    
+    def __init__(self, maxsize=POOL_SIZE):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            maxsize (int): Maximum number of idle connections kept open
+        """
+        self.path = None
+        self._idle = queue.LifoQueue(maxsize=maxsize)
+    
+    def get(self):
+        """
+        Check out an idle connection, opening a new one if none is available.
+        
+        Returns:
+            sqlite3.Connection: Database connection object
+        """
+        if self.path != DB_PATH:
+            self.clear()
+            self.path = DB_PATH
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return _open_connection()
+    
+    def put(self, conn):
+        """
+        Return a connection to the pool, closing it if it cannot be reused.
+        
+        Args:
+            conn (sqlite3.Connection): Connection previously checked out
+        """
+        if self.path != DB_PATH:
+            conn.close()
+            return
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    
+    def clear(self):
+        """Close every idle connection held by the pool."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pool = SQLiteConnectionPool()
+
+
+def close_all():
+    """
+    Close every idle pooled connection.
+    
+    Registered with atexit so the session's connections are closed cleanly,
+    which lets the last one checkpoint and remove the WAL file.
+    """
+    _pool.clear()
+
+
+atexit.register(close_all)
+
+# Per-thread state; holds the connection of the transaction() block in progress
+_local = threading.local()
+
+
+def _active_transaction():
+    """Return the connection of this thread's open transaction(), if any."""
+    return getattr(_local, "transaction_conn", None)
+
+
 def get_connection():
     """
     Return a database connection object.
     
+    The connection is taken from the pool when one is idle. Callers may either
+    close it when done or hand it back with return_connection() so it can be
+    reused.
+    
     Returns:
         sqlite3.Connection: Database connection object
         
@@ -119,14 +394,82 @@ def get_connection():
         sqlite3.Error: If connection fails
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        return conn
+        return _pool.get()
     except sqlite3.Error as e:
         print(f"Database connection error: {e}")
         raise
 
 
+def return_connection(conn):
+    """
+    Hand a connection obtained from get_connection() back to the pool.
+    
+    Args:
+        conn (sqlite3.Connection): Connection to return
+    """
+    _pool.put(conn)
+
+
+@contextmanager
+def connection():
+    """
+    Context manager that checks a pooled connection out and back in.
+    
+    The connection is returned to the pool when the block exits normally and
+    closed if the block raises, so a connection in an unknown state is never
+    reused.
+    
+    Yields:
+        sqlite3.Connection: Database connection object
+    """
+    conn = _active_transaction()
+    if conn is not None:
+        # Join the enclosing transaction() instead of checking out a new connection
+        yield conn
+        return
+    
+    conn = get_connection()
+    try:
+        yield conn
+    except BaseException:
+        conn.close()
+        raise
+    return_connection(conn)
+
+
+@contextmanager
+def transaction():
+    """
+    Context manager that groups several statements into one transaction.
+    
+    Issues BEGIN IMMEDIATE on entry and COMMIT on a clean exit, or ROLLBACK if
+    the block raises. While the block runs, execute_query(), fetch_all() and
+    fetch_one() on the same thread use the transaction's connection and leave
+    committing to this context manager, so N writes cost one commit instead
+    of N. Nested transaction() blocks join the outermost one.
+    
+    Yields:
+        sqlite3.Connection: Connection the transaction runs on
+    """
+    conn = _active_transaction()
+    if conn is not None:
+        yield conn
+        return
+    
+    with connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _local.transaction_conn = conn
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            _local.transaction_conn = None
+
+
 def execute_query(query, params=None):
     """
     Execute a SQL query safely with parameter binding.
@@ -142,17 +485,42 @@ def execute_query(query, params=None):
         sqlite3.Error: If query execution fails
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        with connection() as conn:
+            cursor = conn.cursor()
+            
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            # Inside transaction() the commit happens when the block exits
+            if _active_transaction() is None:
+                conn.commit()
+            return cursor
+    except sqlite3.Error as e:
+        print(f"Query execution error: {e}")
+        raise
+
+
+def execute_many(query, seq_of_params):
+    """
+    Execute a SQL statement once per parameter tuple in a single transaction.
+    
+    Args:
+        query (str): SQL query string
+        seq_of_params (iterable): Sequence of parameter tuples
         
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
+    Returns:
+        sqlite3.Cursor: Cursor object with executed query
         
-        conn.commit()
-        conn.close()
-        return cursor
+    Raises:
+        sqlite3.Error: If query execution fails
+    """
+    try:
+        with transaction() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(query, seq_of_params)
+            return cursor
     except sqlite3.Error as e:
         print(f"Query execution error: {e}")
         raise
@@ -170,17 +538,15 @@ def fetch_all(query, params=None):
         list: List of dictionaries representing rows, or empty list on error
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        
-        # Convert rows to dictionaries
-        rows = cursor.fetchall()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.shared_cursor()
+            
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            rows = cursor.fetchall()
         
         # Convert Row objects to dictionaries
         return [dict(row) for row in rows]
@@ -192,6 +558,75 @@ def fetch_all(query, params=None):
         return []
 
 
+def fetch_all_rows(query, params=None):
+    """
+    Fetch all results from a query without converting them to dictionaries.
+    
+    sqlite3.Row supports both positional and by-name access, so read paths
+    that only iterate or index the results can skip the per-row dict copy
+    done by fetch_all().
+    
+    Args:
+        query (str): SQL query string
+        params (tuple, optional): Parameters for the query
+        
+    Returns:
+        list: List of sqlite3.Row objects, or empty list on error
+    """
+    try:
+        with connection() as conn:
+            cursor = conn.shared_cursor()
+            
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        print(f"Fetch error: {e}")
+        return []
+    except Exception as e:
+        print(f"Unexpected error during fetch: {e}")
+        return []
+
+
+def fetch_all_tuples(query, params=None):
+    """
+    Fetch all results from a query as plain tuples.
+    
+    The row factory is cleared for this query, so sqlite3 builds bare tuples
+    instead of sqlite3.Row objects. Use this for positional read paths,
+    such as rendering tables, that never access columns by name.
+    
+    Args:
+        query (str): SQL query string
+        params (tuple, optional): Parameters for the query
+        
+    Returns:
+        list: List of tuples, or empty list on error
+    """
+    try:
+        with connection() as conn:
+            cursor = conn.shared_cursor()
+            cursor.row_factory = None
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                return cursor.fetchall()
+            finally:
+                cursor.row_factory = conn.row_factory
+    except sqlite3.Error as e:
+        print(f"Fetch error: {e}")
+        return []
+    except Exception as e:
+        print(f"Unexpected error during fetch: {e}")
+        return []
+
+
 def fetch_one(query, params=None):
     """
     Fetch a single result from a query.
@@ -204,16 +639,15 @@ def fetch_one(query, params=None):
         dict: Dictionary representing the row, or None if not found or on error
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        
-        row = cursor.fetchone()
-        conn.close()
+        with connection() as conn:
+            cursor = conn.cursor()
+            
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            row = cursor.fetchone()
         
         if row:
             return dict(row)
@@ -226,6 +660,24 @@ def fetch_one(query, params=None):
         return None
 
 
+
+def table_version(table):
+    """
+    Return the change counter of one of VERSIONED_TABLES.
+    
+    The counter is bumped by a trigger on every INSERT, UPDATE and DELETE,
+    whichever connection or process made it, so an unchanged value means
+    data cached from the table is still current.
+    
+    Args:
+        table (str): Table name, e.g. 'workers'
+        
+    Returns:
+        int: Current version, or None if unavailable
+    """
+    row = fetch_one("SELECT version FROM data_versions WHERE name = ?", (table,))
+    return row['version'] if row else None
+
+
 # Database initialization is handled by main.py
 # This module should not be run directly
-
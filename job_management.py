@@ -5,199 +5,416 @@ This module handles job posting, viewing, searching, and management operations.
 Owner: Sylvie Uwera
 """
 
+import re
+from typing import Literal
 import database
-from tabulate import tabulate
-from models import Job, validate_location
-from utils import print_error, print_success, print_info
+from models import Job
+from utils import print_error, print_success, print_info, print_table
 
 
-def post_job(farmer_id: int):
+# SQL used by this module. Keeping each statement as a single constant means every
+# call sends byte-identical text, so the pooled connections' sqlite3 statement cache
+# returns the already-prepared statement instead of re-parsing it.
+_SQL_INSERT_JOB = """
+    INSERT INTO jobs (farmer_id, title, description, skill_required, location, duration, pay_rate, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Listing queries share one projection, matching _JOB_HEADERS below
+_SQL_SELECT_JOB_ROWS = """
+    SELECT job_id, title, skill_required, location,
+           COALESCE(duration, 'N/A'), COALESCE(pay_rate, 'N/A'),
+           status, COALESCE(posted_date, 'N/A')
+    FROM jobs
+"""
+
+_SQL_COUNT_JOBS = "SELECT COUNT(*) FROM jobs "
+# job_id breaks posted_date ties (bulk posts share one timestamp) so that
+# LIMIT/OFFSET pages never repeat or skip a job
+_SQL_PAGE = " ORDER BY posted_date DESC, job_id DESC LIMIT ? OFFSET ?"
+
+
+def _listing_sql(where):
+    """Build the (page query, count query) pair for a job listing filter."""
+    return _SQL_SELECT_JOB_ROWS + where + _SQL_PAGE, _SQL_COUNT_JOBS + where
+
+
+_SQL_ALL_JOBS = _listing_sql("")
+_SQL_FARMER_JOBS = _listing_sql("WHERE farmer_id = ?")
+
+# Location search modes. Exact and prefix matches can seek idx_jobs_location_nocase
+# (LIKE is case-insensitive, so a 'text%' pattern becomes a NOCASE range scan);
+# only substring search has to scan the whole table.
+_SQL_SEARCH_BY_LOCATION = {
+    "exact": _listing_sql("WHERE location = ? COLLATE NOCASE"),
+    "prefix": _listing_sql("WHERE location LIKE ? ESCAPE '\\'"),
+    "substring": _listing_sql("WHERE location LIKE ? ESCAPE '\\'"),
+}
+_SQL_SELECT_BY_STATUS = _listing_sql("WHERE status = ?")
+
+# Title/skill searches go through the jobs_fts full-text index and are ordered
+# by relevance instead of scanning every row with LIKE '%...%'
+_SQL_SEARCH_FTS = ("""
+    SELECT j.job_id, j.title, j.skill_required, j.location,
+           COALESCE(j.duration, 'N/A'), COALESCE(j.pay_rate, 'N/A'),
+           j.status, COALESCE(j.posted_date, 'N/A')
+    FROM jobs_fts
+    JOIN jobs j ON j.job_id = jobs_fts.rowid
+    WHERE jobs_fts MATCH ?
+    ORDER BY jobs_fts.rank, j.job_id DESC
+    LIMIT ? OFFSET ?
+""", "SELECT COUNT(*) FROM jobs_fts WHERE jobs_fts MATCH ?")
+
+_FTS_TOKEN = re.compile(r"\w+", re.UNICODE)
+_SQL_SELECT_JOB = """
+    SELECT job_id, farmer_id, title, description, skill_required, location, duration, pay_rate, status
+    FROM jobs
+    WHERE job_id = ?
+"""
+_SQL_UPDATE_JOB = """
+    UPDATE jobs
+    SET title = ?, description = ?, skill_required = ?, location = ?, duration = ?, pay_rate = ?
+    WHERE job_id = ?
+"""
+_SQL_UPDATE_STATUS = "UPDATE jobs SET status = ? WHERE job_id = ?"
+_SQL_DELETE_JOB = "DELETE FROM jobs WHERE job_id = ? RETURNING title"
+
+# Maximum number of rows sent per executemany() call by post_jobs_bulk
+BULK_INSERT_CHUNK_SIZE = 10000
+
+# Number of jobs shown per page by the listing views
+DEFAULT_PAGE_SIZE = 50
+
+# Column headers for job listings, in the column order of the SELECTs above
+_JOB_HEADERS = ["Job ID", "Title", "Skills Required", "Location", "Duration", "Pay Rate", "Status", "Posted Date"]
+
+
+def _render_jobs(rows):
     """
-    Post a new job for a specific farmer.
+    Print job rows as a table.
+    
+    Rows already hold display values (NULLs are COALESCEd to 'N/A' in SQL).
+    The "simple" format is used because "grid" draws a border line between
+    every row, roughly doubling the output for large listings.
     
     Args:
-        farmer_id (int): ID of the farmer posting the job
+        rows (list): Rows from one of the job listing queries
     """
-    print("\n--- Post a New Job ---")
+    print_table(rows, _JOB_HEADERS, tablefmt="simple")
+
+
+def _fts_query(column, text):
+    """
+    Build an FTS5 MATCH expression requiring every word of `text` as a prefix in `column`.
     
-    title = input("Enter job title: ").strip()
-    if not title:
-        print_error("Job title is required.")
-        return
+    Each word is quoted, so FTS5 operators typed by the user are matched literally.
     
-    description = input("Enter job description (optional): ").strip() or None
+    Args:
+        column (str): jobs_fts column to search
+        text (str): User-entered search text
     
-    skill_required = input("Enter required skill: ").strip()
-    if not skill_required:
-        print_error("Required skill is needed.")
-        return
+    Returns:
+        str: MATCH expression, or None if `text` contains no searchable words
+    """
+    tokens = _FTS_TOKEN.findall(text)
+    if not tokens:
+        return None
+    return " AND ".join(f'{column} : "{token}"*' for token in tokens)
+
+
+def _list_jobs(listing, params, limit, offset, empty_message):
+    """
+    Display a job listing one page at a time.
+    
+    Only `limit` rows are fetched per page with LIMIT/OFFSET, so large job
+    tables are never loaded in full. The total is counted only when the first
+    page is full, and the user is asked before each further page is fetched.
     
-    location = input("Enter job location: ").strip()
-    if not validate_location(location):
-        print_error("Invalid location.")
+    Args:
+        listing (tuple): (page query, count query) pair from _listing_sql()
+        params (tuple): Parameters for the listing's WHERE clause
+        limit (int): Maximum number of jobs per page
+        offset (int): Number of jobs to skip before the first page
+        empty_message (str): Message shown when no jobs match
+    """
+    page_sql, count_sql = listing
+    jobs = database.fetch_all_tuples(page_sql, params + (limit, offset))
+    
+    if not jobs:
+        print_info(empty_message)
         return
     
-    duration = input("Enter job duration (optional): ").strip() or None
-    pay_rate = input("Enter pay rate (optional): ").strip() or None
+    if len(jobs) < limit:
+        total = offset + len(jobs)
+    else:
+        total = database.fetch_all_tuples(count_sql, params)[0][0]
+    
+    while True:
+        _render_jobs(jobs)
+        shown = offset + len(jobs)
+        print(f"\nShowing jobs {offset + 1}-{shown} of {total}.")
+        if shown >= total:
+            return
+        
+        answer = input(f"{total - shown} more - press Enter for the next page or 'q' to stop: ")
+        if answer.strip().lower() == 'q':
+            return
+        
+        offset = shown
+        jobs = database.fetch_all_tuples(page_sql, params + (limit, offset))
+        if not jobs:
+            return
+
+
+def post_job(farmer_id: int):
+    """
+    Prompt for a new job for a specific farmer and post it.
+    
+    Args:
+        farmer_id (int): ID of the farmer posting the job
+    """
+    print("\n--- Post a New Job ---")
+    
+    data = {
+        'title': input("Enter job title: "),
+        'description': input("Enter job description (optional): "),
+        'skill_required': input("Enter required skill: "),
+        'location': input("Enter job location: "),
+        'duration': input("Enter job duration (optional): "),
+        'pay_rate': input("Enter pay rate (optional): "),
+    }
     
-    # Create job model and validate
+    job_id = post_job_from_dict(farmer_id, data)
+    if job_id is not None:
+        print_success(f"Job posted successfully! Job ID: {job_id}")
+
+
+def _clean_field(value):
+    """Strip a submitted field, mapping empty strings to None."""
+    if isinstance(value, str):
+        value = value.strip()
+    return value or None
+
+
+def post_job_from_dict(farmer_id: int, data: dict):
+    """
+    Validate and post a job described by a dictionary, without prompting.
+    
+    This is the non-interactive core of post_job(), usable by imports and
+    other callers that already have the job fields.
+    
+    Args:
+        farmer_id (int): ID of the farmer posting the job
+        data (dict): Job fields: title, skill_required, location and optionally
+            description, duration, pay_rate
+        
+    Returns:
+        int: ID of the new job, or None if validation or the insert failed
+    """
     job = Job(
         farmer_id=farmer_id,
-        title=title,
-        description=description,
-        skill_required=skill_required,
-        location=location,
-        duration=duration,
-        pay_rate=pay_rate,
+        title=_clean_field(data.get('title')),
+        description=_clean_field(data.get('description')),
+        skill_required=_clean_field(data.get('skill_required')),
+        location=_clean_field(data.get('location')),
+        duration=_clean_field(data.get('duration')),
+        pay_rate=_clean_field(data.get('pay_rate')),
         status='open'
     )
     
-    is_valid, error = job.validate()
-    if not is_valid:
-        print_error(error)
-        return
+    job_ids = post_jobs_bulk([job])
+    return job_ids[0] if job_ids else None
+
+
+def post_jobs_bulk(jobs):
+    """
+    Insert many jobs in a single transaction.
     
-    try:
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO jobs (farmer_id, title, description, skill_required, location, duration, pay_rate, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (job.farmer_id, job.title, job.description, job.skill_required, 
-             job.location, job.duration, job.pay_rate, job.status)
-        )
-        conn.commit()
-        job_id = cursor.lastrowid
-        conn.close()
+    Every job is validated before anything is written, so either all jobs are
+    posted or none are. Rows are sent with executemany() in chunks of
+    BULK_INSERT_CHUNK_SIZE, which reuses one prepared statement and one commit
+    for the whole batch.
+    
+    Args:
+        jobs (list): List of Job instances to insert
         
-        print_success(f"Job posted successfully! Job ID: {job_id}")
+    Returns:
+        list: IDs of the inserted jobs in input order, or None on failure
+    """
+    rows = []
+    for index, job in enumerate(jobs, 1):
+        is_valid, error = job.validate()
+        if not is_valid:
+            print_error(error if len(jobs) == 1 else f"Job {index}: {error}")
+            return None
+        rows.append((job.farmer_id, job.title, job.description, job.skill_required,
+                     job.location, job.duration, job.pay_rate, job.status))
+    
+    if not rows:
+        return []
+    
+    try:
+        job_ids = []
+        with database.transaction() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+                cursor.executemany(_SQL_INSERT_JOB, chunk)
+                # The transaction holds the write lock, so AUTOINCREMENT assigned
+                # this chunk consecutive IDs ending at last_insert_rowid()
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                job_ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+        return job_ids
     except Exception as e:
         print_error(f"Failed to post job: {e}")
+        return None
+
+
+def view_all_jobs(limit: int = DEFAULT_PAGE_SIZE, offset: int = 0):
+    """Display all jobs in a formatted table, one page at a time."""
+    _list_jobs(_SQL_ALL_JOBS, (), limit, offset, "No jobs found.")
+
+
+def view_farmer_jobs(farmer_id: int, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0):
+    """Display jobs posted by a specific farmer."""
+    _list_jobs(_SQL_FARMER_JOBS, (farmer_id,), limit, offset, "You have no jobs posted.")
+
 
+def _escape_like(text):
+    """Escape LIKE wildcards in user input so they match literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
-def view_all_jobs():
-    """Display all jobs in a formatted table."""
-    jobs = database.fetch_all("""
-        SELECT job_id, title, skill_required, location, duration, pay_rate, status, posted_date
-        FROM jobs
-        ORDER BY posted_date DESC
-    """)
+
+def search_jobs_by_location(location: str,
+                            mode: Literal["exact", "prefix", "substring"] = "prefix",
+                            limit: int = DEFAULT_PAGE_SIZE, offset: int = 0):
+    """
+    Search and display jobs by location.
     
-    if not jobs:
-        print_info("No jobs found.")
+    Args:
+        location (str): Location to search for (case-insensitive)
+        mode (str): 'exact' for the whole location, 'prefix' for locations
+            starting with it, or 'substring' for locations containing it
+        limit (int): Maximum number of jobs per page
+        offset (int): Number of jobs to skip before the first page
+    """
+    if not location or not location.strip():
+        print_error("Location cannot be empty.")
         return
     
-    # Convert to list of lists for tabulate
-    table_data = []
-    for job in jobs:
-        table_data.append([
-            job['job_id'],
-            job['title'],
-            job['skill_required'],
-            job['location'],
-            job['duration'] or 'N/A',
-            job['pay_rate'] or 'N/A',
-            job['status'],
-            job['posted_date'] or 'N/A'
-        ])
-    
-    headers = ["Job ID", "Title", "Skills Required", "Location", "Duration", "Pay Rate", "Status", "Posted Date"]
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
-
-
-def view_farmer_jobs(farmer_id: int):
-    """Display jobs posted by a specific farmer."""
-    jobs = database.fetch_all(
-        """
-        SELECT job_id, title, skill_required, location, duration, pay_rate, status, posted_date
-        FROM jobs
-        WHERE farmer_id = ?
-        ORDER BY posted_date DESC
-        """,
-        (farmer_id,)
-    )
+    if mode not in _SQL_SEARCH_BY_LOCATION:
+        print_error("Invalid search mode. Must be 'exact', 'prefix', or 'substring'.")
+        return
     
-    if not jobs:
-        print_info("You have no jobs posted.")
+    location = location.strip()
+    if mode == "exact":
+        param = location
+    elif mode == "prefix":
+        param = f"{_escape_like(location)}%"
+    else:
+        param = f"%{_escape_like(location)}%"
+    
+    _list_jobs(_SQL_SEARCH_BY_LOCATION[mode], (param,), limit, offset,
+               f"No jobs found in '{location}'.")
+
+
+def view_jobs_by_skill(skill: str, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0):
+    """Search and display jobs by required skill."""
+    if not skill or not skill.strip():
+        print_error("Skill cannot be empty.")
         return
     
-    # Convert to list of lists for tabulate
-    table_data = []
-    for job in jobs:
-        table_data.append([
-            job['job_id'],
-            job['title'],
-            job['skill_required'],
-            job['location'],
-            job['duration'] or 'N/A',
-            job['pay_rate'] or 'N/A',
-            job['status'],
-            job['posted_date'] or 'N/A'
-        ])
-    
-    headers = ["Job ID", "Title", "Skills Required", "Location", "Duration", "Pay Rate", "Status", "Posted Date"]
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
-
-
-def search_jobs_by_location(location: str):
-    """Search and display jobs by location."""
-    if not location or not location.strip():
-        print_error("Location cannot be empty.")
+    query = _fts_query("skill_required", skill)
+    if query is None:
+        print_info(f"No jobs found requiring '{skill}'.")
         return
     
-    location_pattern = f"%{location.strip()}%"
-    jobs = database.fetch_all(
-        """
-        SELECT job_id, title, skill_required, location, duration, pay_rate, status, posted_date
-        FROM jobs
-        WHERE location LIKE ?
-        ORDER BY posted_date DESC
-        """,
-        (location_pattern,)
-    )
+    _list_jobs(_SQL_SEARCH_FTS, (query,), limit, offset, f"No jobs found requiring '{skill}'.")
+
+
+def view_jobs_by_title(title: str, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0):
+    """Search and display jobs by title."""
+    if not title or not title.strip():
+        print_error("Title cannot be empty.")
+        return
     
-    if not jobs:
-        print_info(f"No jobs found in '{location}'.")
+    query = _fts_query("title", title)
+    if query is None:
+        print_info(f"No jobs found matching '{title}'.")
         return
     
-    # Convert to list of lists for tabulate
-    table_data = []
-    for job in jobs:
-        table_data.append([
-            job['job_id'],
-            job['title'],
-            job['skill_required'],
-            job['location'],
-            job['duration'] or 'N/A',
-            job['pay_rate'] or 'N/A',
-            job['status'],
-            job['posted_date'] or 'N/A'
-        ])
+    _list_jobs(_SQL_SEARCH_FTS, (query,), limit, offset, f"No jobs found matching '{title}'.")
+
+
+def view_jobs_by_status(status: str, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0):
+    """Display jobs with a given status (open/filled/closed)."""
+    status = status.lower()
+    if status not in Job.VALID_STATUSES:
+        print_error("Invalid status. Must be 'open', 'filled', or 'closed'.")
+        return
     
-    headers = ["Job ID", "Title", "Skills Required", "Location", "Duration", "Pay Rate", "Status", "Posted Date"]
-    print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    _list_jobs(_SQL_SELECT_BY_STATUS, (status,), limit, offset, f"No {status} jobs found.")
+
+
+def update_job(job_id: int):
+    """
+    Prompt for new values and update a job's details.
+    
+    Pressing Enter at a prompt keeps the current value. The current row is
+    read before prompting and the UPDATE runs in its own short transaction
+    afterwards, so no connection or read snapshot is held while waiting for
+    the user to type.
+    
+    Args:
+        job_id (int): ID of the job to update
+    """
+    current = database.fetch_one(_SQL_SELECT_JOB, (job_id,))
+    if not current:
+        print_error(f"Job with ID {job_id} not found.")
+        return
+    
+    print("\n--- Update Job (press Enter to keep the current value) ---")
+    updated = {}
+    for key, label in (('title', "Job title"), ('description', "Description"),
+                       ('skill_required', "Required skill"), ('location', "Location"),
+                       ('duration', "Duration"), ('pay_rate', "Pay rate")):
+        answer = input(f"{label} [{current[key] or ''}]: ").strip()
+        updated[key] = answer or current[key]
+    
+    job = Job(farmer_id=current['farmer_id'], status=current['status'], job_id=job_id, **updated)
+    is_valid, error = job.validate()
+    if not is_valid:
+        print_error(error)
+        return
+    
+    try:
+        with database.transaction() as conn:
+            cursor = conn.execute(
+                _SQL_UPDATE_JOB,
+                (job.title, job.description, job.skill_required, job.location,
+                 job.duration, job.pay_rate, job_id)
+            )
+        if cursor.rowcount == 0:
+            # Deleted while the user was typing
+            print_error(f"Job with ID {job_id} not found.")
+            return
+        print_success("Job updated successfully!")
+    except Exception as e:
+        print_error(f"Failed to update job: {e}")
 
 
 def update_job_status(job_id: int, new_status: str):
     """Update a job's status (open/filled/closed)."""
     new_status = new_status.lower()
-    if new_status not in ("open", "filled", "closed"):
+    if new_status not in Job.VALID_STATUSES:
         print_error("Invalid status. Must be 'open', 'filled', or 'closed'.")
         return
     
-    # Check if job exists
-    job = database.fetch_one("SELECT job_id FROM jobs WHERE job_id = ?", (job_id,))
-    if not job:
-        print_error(f"Job with ID {job_id} not found.")
-        return
-    
     try:
-        database.execute_query(
-            "UPDATE jobs SET status = ? WHERE job_id = ?",
-            (new_status, job_id)
-        )
+        cursor = database.execute_query(_SQL_UPDATE_STATUS, (new_status, job_id))
+        if cursor.rowcount == 0:
+            print_error(f"Job with ID {job_id} not found.")
+            return
         print_success(f"Job status updated to '{new_status}'.")
     except Exception as e:
         print_error(f"Failed to update job status: {e}")
@@ -205,24 +422,29 @@ def update_job_status(job_id: int, new_status: str):
 
 def delete_job(job_id: int):
     """Delete a job from the database."""
-    # Check if job exists
-    job = database.fetch_one("SELECT job_id, title FROM jobs WHERE job_id = ?", (job_id,))
-    if not job:
-        print_error(f"Job with ID {job_id} not found.")
-        return
-    
     try:
-        database.execute_query("DELETE FROM jobs WHERE job_id = ?", (job_id,))
-        print_success(f"Job '{job.get('title', job_id)}' deleted successfully.")
+        # RETURNING hands back the title from the DELETE itself (SQLite 3.35+)
+        with database.transaction() as conn:
+            row = conn.execute(_SQL_DELETE_JOB, (job_id,)).fetchone()
+        if row is None:
+            print_error(f"Job with ID {job_id} not found.")
+            return
+        print_success(f"Job '{row['title']}' deleted successfully.")
     except Exception as e:
         print_error(f"Failed to delete job: {e}")
 
 
 __all__ = [
     "post_job",
+    "post_job_from_dict",
+    "post_jobs_bulk",
     "view_all_jobs",
     "view_farmer_jobs",
     "update_job_status",
     "delete_job",
     "search_jobs_by_location",
+    "view_jobs_by_skill",
+    "view_jobs_by_title",
+    "view_jobs_by_status",
+    "update_job",
 ]
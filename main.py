@@ -1,4 +1,5 @@
 
+import argparse
 import sys
 from utils import (
     clear_screen, print_header, print_separator, 
@@ -54,13 +55,21 @@ def handle_worker_registration():
         pause()
 
 
+def load_farmer_jobs(farmer_id):
+    """Fetch the id, title and status of every job a farmer has posted."""
+    return database.fetch_all_rows(
+        "SELECT job_id, title, status FROM jobs WHERE farmer_id = ?",
+        (farmer_id,)
+    )
+
+
 def handle_farmer_login():
     
     try:
         clear_screen()
         print_header("Farmer Login")
         
-        farmers = database.fetch_all("SELECT farmer_id, name, location FROM farmers")
+        farmers = database.fetch_all_rows("SELECT farmer_id, name, location FROM farmers")
         
         if not farmers:
             print_info("No farmers registered yet. Please register first.")
@@ -78,6 +87,10 @@ def handle_farmer_login():
         farmer_id = selected_farmer["farmer_id"]
         farmer_name = selected_farmer["name"]
         
+        # The farmer's jobs are fetched once and shared by the find/update/delete
+        # options; reset to None whenever this session posts, updates or deletes one
+        session_jobs = None
+        
         while True:
             choice = display_farmer_menu(farmer_name)
             
@@ -91,6 +104,7 @@ def handle_farmer_login():
                 clear_screen()
                 print_header("Post New Job")
                 job_management.post_job(farmer_id)
+                session_jobs = None
                 pause()
                 
             elif choice == 3:
@@ -102,10 +116,9 @@ def handle_farmer_login():
             elif choice == 4:
                 clear_screen()
                 print_header("Find Workers")
-                jobs = database.fetch_all(
-                    "SELECT job_id, title FROM jobs WHERE farmer_id = ? AND status = 'open'",
-                    (farmer_id,)
-                )
+                if session_jobs is None:
+                    session_jobs = load_farmer_jobs(farmer_id)
+                jobs = [job for job in session_jobs if job['status'] == 'open']
                 
                 if not jobs:
                     print_info("You have no open jobs.")
@@ -127,10 +140,9 @@ def handle_farmer_login():
             elif choice == 5:
                 clear_screen()
                 print_header("Update Job Status")
-                jobs = database.fetch_all(
-                    "SELECT job_id, title, status FROM jobs WHERE farmer_id = ?",
-                    (farmer_id,)
-                )
+                if session_jobs is None:
+                    session_jobs = load_farmer_jobs(farmer_id)
+                jobs = session_jobs
                 
                 if not jobs:
                     print_info("You have no jobs posted.")
@@ -150,15 +162,15 @@ def handle_farmer_login():
                 new_status = display_job_status_menu()
                 
                 job_management.update_job_status(job_id, new_status)
+                session_jobs = None
                 pause()
                 
             elif choice == 6:
                 clear_screen()
                 print_header("Delete Job")
-                jobs = database.fetch_all(
-                    "SELECT job_id, title FROM jobs WHERE farmer_id = ?",
-                    (farmer_id,)
-                )
+                if session_jobs is None:
+                    session_jobs = load_farmer_jobs(farmer_id)
+                jobs = session_jobs
                 
                 if not jobs:
                     print_info("You have no jobs to delete.")
@@ -176,6 +188,7 @@ def handle_farmer_login():
                 
                 if confirm_action("Are you sure you want to delete this job?"):
                     job_management.delete_job(job_id)
+                    session_jobs = None
                     pause()
                 
             elif choice == 7:
@@ -195,7 +208,7 @@ def handle_worker_login():
         clear_screen()
         print_header("Worker Login")
         
-        workers = database.fetch_all("SELECT worker_id, name, skills FROM workers")
+        workers = database.fetch_all_rows("SELECT worker_id, name, skills FROM workers")
         
         if not workers:
             print_info("No workers registered yet. Please register first.")
@@ -255,7 +268,7 @@ def handle_worker_login():
                 clear_screen()
                 print_header("Search Jobs by Location")
                 location = input("Enter location: ").strip()
-                job_management.search_jobs_by_location(location)
+                job_management.search_jobs_by_location(location, mode="substring")
                 pause()
                 
             elif choice == 7:
@@ -287,7 +300,7 @@ def handle_search_jobs():
         location = input("Enter location to search: ").strip()
         
         if location:
-            job_management.search_jobs_by_location(location)
+            job_management.search_jobs_by_location(location, mode="substring")
         else:
             print_error("Location cannot be empty.")
             
@@ -297,12 +310,29 @@ def handle_search_jobs():
         pause()
 
 
-def main():
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Local Agricultural Job Board & Skills Matcher")
+    p.add_argument("--import-farmers", metavar="CSV",
+                   help="Register the farmers listed in a CSV file, then exit")
+    p.add_argument("--import-workers", metavar="CSV",
+                   help="Register the workers listed in a CSV file, then exit")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     
     if not initialize_system():
         print_error("System initialization failed. Exiting...")
         sys.exit(1)
     
+    if args.import_farmers or args.import_workers:
+        if args.import_farmers:
+            user_management.import_users_csv(args.import_farmers, "farmer")
+        if args.import_workers:
+            user_management.import_users_csv(args.import_workers, "worker")
+        return
+    
     display_welcome_message()
     
     while True:
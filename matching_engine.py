@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import functools
+import heapq
 import math
 import sys
+import threading
+from dataclasses import dataclass
 import argparse
-from typing import List, Tuple, Optional, Dict, Any
+from itertools import chain, repeat
+from typing import List, Tuple, Optional, Dict, Any, FrozenSet, Iterable, Callable, Set
 
 # Import application modules (assumes database.py and models.py are in same dir or in PYTHONPATH)
 try:
@@ -16,7 +21,7 @@ except Exception as e:
     raise
 
 try:
-    from tabulate import tabulate
+    from utils import print_table
 except Exception:
     print("Missing dependency 'tabulate'. Install with: pip install tabulate")
     raise
@@ -30,25 +35,27 @@ def parse_latlon(location: str) -> Optional[Dict[str, float]]:
     """
     if not location or not isinstance(location, str):
         return None
-    parts = [p.strip() for p in location.split(',')]
-    if len(parts) != 2:
+    lat, comma, lon = location.partition(',')
+    if not comma or ',' in lon:
         return None
     try:
-        lat = float(parts[0])
-        lon = float(parts[1])
-        return {"lat": lat, "lon": lon}
+        return {"lat": float(lat.strip()), "lon": float(lon.strip())}
     except ValueError:
         return None
 
+# Same factor math.radians() multiplies by, so results are bit-identical
+_DEG2RAD = math.pi / 180.0
+_EARTH_DIAMETER_KM = 2 * 6371.0
+
 def haversine_km(a: Dict[str, float], b: Dict[str, float]) -> float:
     """Return great-circle distance (km) between two points {'lat','lon'}."""
-    lat1, lon1 = math.radians(a["lat"]), math.radians(a["lon"])
-    lat2, lon2 = math.radians(b["lat"]), math.radians(b["lon"])
+    sin, cos = math.sin, math.cos
+    lat1, lon1 = a["lat"] * _DEG2RAD, a["lon"] * _DEG2RAD
+    lat2, lon2 = b["lat"] * _DEG2RAD, b["lon"] * _DEG2RAD
     dlat = lat2 - lat1
     dlon = lon2 - lon1
-    r = 6371.0
-    h = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    return 2 * r * math.asin(math.sqrt(h))
+    h = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
+    return _EARTH_DIAMETER_KM * math.asin(math.sqrt(h))
 
 def normalize_skill(s: str) -> str:
     return s.strip().lower()
@@ -69,9 +76,16 @@ def match_location_text(loc1: str, loc2: str) -> float:
     if not loc1 or not loc2:
         return 0.5  # Neutral if either is missing
     
+    # The score is symmetric, so (a, b) and (b, a) share one cache entry
     loc1_lower = loc1.strip().lower()
     loc2_lower = loc2.strip().lower()
-    
+    if loc2_lower < loc1_lower:
+        loc1_lower, loc2_lower = loc2_lower, loc1_lower
+    return _match_location_text_cached(loc1_lower, loc2_lower)
+
+@functools.lru_cache(maxsize=4096)
+def _match_location_text_cached(loc1_lower: str, loc2_lower: str) -> float:
+    """match_location_text() on normalized strings; many candidates share a village name."""
     # Exact match
     if loc1_lower == loc2_lower:
         return 1.0
@@ -95,171 +109,442 @@ def match_location_text(loc1: str, loc2: str) -> float:
 
 # --------------------------- Matching Logic ------------------------------
 
+@functools.lru_cache(maxsize=4096)
+def parse_skills(skills: Optional[str]) -> FrozenSet[str]:
+    """
+    Split a comma-separated skill list into a set of normalized skills.
+    Memoized: the same skill strings recur across rows and repeated requests.
+    """
+    return frozenset(normalize_skill(s) for s in str(skills or "").split(',') if s.strip())
+
+# Every distinct normalized skill gets one bit, so a skill list becomes an int
+# and overlap is an AND plus a popcount instead of a set intersection.
+SKILL_IDX: Dict[str, int] = {}
+_skill_idx_lock = threading.Lock()
+
+popcount = getattr(int, "bit_count", lambda x: bin(x).count("1"))  # int.bit_count needs 3.10
+
+def skill_bits(skills: FrozenSet[str]) -> int:
+    """Encode a set of normalized skills as a bitset over SKILL_IDX."""
+    bits = 0
+    for skill in skills:
+        idx = SKILL_IDX.get(skill)
+        if idx is None:
+            with _skill_idx_lock:
+                idx = SKILL_IDX.setdefault(skill, len(SKILL_IDX))
+        bits |= 1 << idx
+    return bits
+
+# Parsed coordinates in the form the distance pass consumes: (lat, lon) in
+# radians plus cos(lat), so the per-pair haversine skips the conversions.
+GeoPoint = Tuple[float, float, float]
+
+# The match target's row paired with its skill bitset and coordinates, parsed
+# once per request (candidates are kept column-wise, see Candidates).
+PreppedRow = Tuple[Dict[str, Any], int, Optional[GeoPoint]]
+
+@functools.lru_cache(maxsize=4096)
+def geo_point(location: str) -> Optional[GeoPoint]:
+    """
+    Parse a location into a GeoPoint, or None if it is not 'lat,lon'. Memoized:
+    the same village strings recur across candidates and every cache refill.
+    """
+    latlon = parse_latlon(location)
+    if latlon is None:
+        return None
+    lat = latlon["lat"] * _DEG2RAD
+    return lat, latlon["lon"] * _DEG2RAD, math.cos(lat)
+
+def prep_worker(worker_row: Dict[str, Any]) -> PreppedRow:
+    return worker_row, skill_bits(parse_skills(worker_row.get("skills"))), geo_point(worker_row.get("location") or "")
+
+def prep_job(job_row: Dict[str, Any]) -> PreppedRow:
+    return job_row, skill_bits(parse_skills(job_row.get("skill_required"))), geo_point(job_row.get("location") or "")
+
+@dataclass
+class Candidates:
+    """
+    Column-oriented (SoA) view of fetched candidate rows, built once per fetch.
+    Scoring walks these flat per-field lists; only the top-N indices are mapped
+    back to their row dicts for display.
+    """
+    rows: List[Dict[str, Any]]
+    bits: List[int]
+    points: List[Optional[GeoPoint]]
+    locations: List[str]
+    availability: List[float]
+    # Candidates in the same village often share exact coordinates, so distances
+    # are computed once per distinct point: point_index maps each candidate to
+    # its entry in unique_points (-1 without coordinates).
+    unique_points: List[GeoPoint]
+    point_index: List[int]
+    # Inverted indexes: SKILL_IDX bit -> candidates holding that skill, and
+    # availability bonus -> candidates with it
+    skill_index: Dict[int, List[int]]
+    by_availability: Dict[float, List[int]]
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]], skills_column: str,
+                  check_availability: bool = False) -> "Candidates":
+        """
+        Build the columns from DB rows. Without check_availability every candidate
+        gets the full availability bonus (open jobs have no availability flag).
+        """
+        points = [geo_point(r.get("location") or "") for r in rows]
+        slots: Dict[GeoPoint, int] = {}
+        point_index = [-1 if p is None else slots.setdefault(p, len(slots)) for p in points]
+        bits = [skill_bits(parse_skills(r.get(skills_column))) for r in rows]
+        availability = [1.0 if not check_availability or r.get("available", 0) else 0.0 for r in rows]
+
+        skill_index: Dict[int, List[int]] = {}
+        by_availability: Dict[float, List[int]] = {}
+        for i, (b, avail) in enumerate(zip(bits, availability)):
+            while b:
+                low = b & -b
+                skill_index.setdefault(low.bit_length() - 1, []).append(i)
+                b ^= low
+            by_availability.setdefault(avail, []).append(i)
+        return cls(
+            rows=rows,
+            bits=bits,
+            points=points,
+            locations=[r.get("location", "") or "" for r in rows],
+            availability=availability,
+            unique_points=list(slots),
+            point_index=point_index,
+            skill_index=skill_index,
+            by_availability=by_availability,
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def prepped(self, i: int) -> PreppedRow:
+        return self.rows[i], self.bits[i], self.points[i]
+
+    def sharing_skills(self, required: int) -> Set[int]:
+        """Indices of the candidates holding at least one of the skills in a bitset."""
+        hits: Set[int] = set()
+        while required:
+            low = required & -required
+            hits.update(self.skill_index.get(low.bit_length() - 1, ()))
+            required ^= low
+        return hits
+
+    def distance_to(self, origin: Optional[GeoPoint]) -> Callable[[int], Optional[float]]:
+        """
+        Return a lookup i -> distance (km) from origin to candidate i, or None
+        without coordinates. Each distinct point's haversine is computed on first
+        lookup only, so candidates that are never scored cost nothing.
+        """
+        if origin is None:
+            return lambda i: None
+        sin, asin, sqrt = math.sin, math.asin, math.sqrt
+        lat1, lon1, cos1 = origin
+        diameter = _EARTH_DIAMETER_KM
+        point_index, unique_points = self.point_index, self.unique_points
+        memo: Dict[int, float] = {}
+
+        def distance(i: int) -> Optional[float]:
+            k = point_index[i]
+            if k < 0:
+                return None
+            d = memo.get(k)
+            if d is None:
+                # Same formula as haversine_km(), with the origin's terms hoisted
+                lat2, lon2, cos2 = unique_points[k]
+                h = sin((lat2 - lat1) / 2) ** 2 + cos1 * cos2 * sin((lon2 - lon1) / 2) ** 2
+                # rounding can push h a hair above 1 for antipodal points
+                d = memo[k] = diameter * asin(sqrt(h if h < 1.0 else 1.0))
+            return d
+        return distance
+
+def proximity_score(dist: Optional[float], loc_a: str, loc_b: str) -> float:
+    """
+    Proximity sub-score 0..1 for a pair: the distance scale when both sides have
+    coordinates, else text matching of the two location strings, else neutral.
+    """
+    if dist is not None:
+        # Use a soft scale: <10km -> 1.0, 10-100 -> linear, >100 -> 0
+        if dist <= 10:
+            return 1.0
+        if dist <= 100:
+            return 1 - ((dist - 10) / 90)  # 1 down to 0
+        return 0.0
+    if loc_a and loc_b:
+        # Fall back to text-based location matching
+        return match_location_text(loc_a, loc_b)
+    return 0.5  # neutral default when no location info
+
+def skill_scores(required: Iterable[int], skills: Iterable[int]) -> List[float]:
+    """Skill sub-score 0..1 of every pair: share of required skills held, 0.5 if none required."""
+    bit_count = popcount
+    return [bit_count(req & have) / bit_count(req) if req else 0.5 for req, have in zip(required, skills)]
+
+# Weighted score: 60% skill, 30% location, 10% availability
+W_SKILL, W_PROX, W_AVAIL = 0.60, 0.30, 0.10
+
+def _clamp(score: float) -> float:
+    return 0.0 if score < 0.0 else 1.0 if score > 1.0 else score
+
+def score_bound(skill: float, availability: float) -> float:
+    """
+    Best score a candidate can reach: its real score with proximity at 1.0. The
+    same expression, so the bound can never fall below a score it stands for.
+    """
+    return _clamp((skill * W_SKILL) + (1.0 * W_PROX) + (availability * W_AVAIL))
+
+def score_bounds(skill: List[float], availability: List[float],
+                 indices: Iterable[int]) -> Dict[float, List[int]]:
+    """Group candidate indices by score_bound() (inlined for the per-candidate pass)."""
+    w_skill, w_prox, w_avail, clamp = W_SKILL, W_PROX, W_AVAIL, _clamp
+    groups: Dict[float, List[int]] = {}
+    for i in indices:
+        groups.setdefault(clamp((skill[i] * w_skill) + (1.0 * w_prox) + (availability[i] * w_avail)), []).append(i)
+    return groups
+
+def rank_candidates(skill: List[float], availability: List[float], proximity_of: Callable[[int], float],
+                    top_n: int, groups: Optional[Dict[float, Iterable[int]]] = None) -> List[Tuple[int, float]]:
+    """
+    Exact top-N (index, score) pairs by weighted score, best first, with ties in
+    candidate order as a stable sort would give.
+    Proximity is the only costly sub-score, so candidates are visited in order of
+    their best possible score (see score_bounds, computed over every candidate
+    unless groups is given) and proximity_of(i) is only called until that bound
+    falls below the current N-th best score. Groups below that point are never
+    iterated, so they may be lazy.
+    """
+    if top_n <= 0:
+        return []
+    if groups is None:
+        groups = score_bounds(skill, availability, range(len(skill)))
+    w_skill, w_prox, w_avail, clamp = W_SKILL, W_PROX, W_AVAIL, _clamp
+
+    best: List[Tuple[float, int]] = []  # min-heap of (score, -index): worst kept entry on top
+    for bound in sorted(groups, reverse=True):
+        if len(best) >= top_n and bound < best[0][0]:
+            break
+        for i in groups[bound]:
+            entry = (clamp((skill[i] * w_skill) + (proximity_of(i) * w_prox) + (availability[i] * w_avail)), -i)
+            if len(best) < top_n:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+    return [(-neg_i, score) for score, neg_i in sorted(best, reverse=True)]
+
+def explain_match(job: PreppedRow, worker: PreppedRow, dist: Optional[float], prox: float,
+                  score: float, availability_note: Optional[str] = None) -> List[str]:
+    """Human-readable reasons behind one pair's score, as shown in the match tables."""
+    reasons = []
+    job_row, job_required, _ = job
+    worker_row, worker_skills, _ = worker
+
+    if not job_required:
+        reasons.append("no required skills (neutral)")
+    else:
+        reasons.append(f"skills matched {popcount(job_required & worker_skills)}/{popcount(job_required)}")
+
+    if dist is not None:
+        reasons.append(f"distance {dist:.1f}km")
+        reasons.append(f"proximity_score {prox:.2f}")
+    elif (worker_row.get("location", "") or "") and (job_row.get("location", "") or ""):
+        reasons.append(f"location text match: {prox:.2f}")
+    else:
+        reasons.append("no location info (proximity neutral)")
+
+    if availability_note:
+        reasons.append(availability_note)
+    reasons.append(f"final_score {score:.3f}")
+    return reasons
+
+# Candidate queries select only the columns scoring and the match tables read
+_SQL_AVAILABLE_WORKERS = "SELECT worker_id, name, skills, location, available FROM workers WHERE available=1"
+_SQL_OPEN_JOBS = ("SELECT job_id, title, skill_required, location, duration, pay_rate "
+                  "FROM jobs WHERE status='open'")
+_SQL_INSERT_MATCHES = "INSERT INTO matches (job_id, worker_id, match_score) VALUES "
+# Rows per multi-row INSERT; 3 parameters each stays under the 999-variable
+# limit of older SQLite builds
+_INSERT_MATCH_ROWS = 333
+_SQL_HAS_MATCHES = "SELECT 1 FROM sqlite_master WHERE type='table' AND name='matches'"
+_SQL_SELECT_JOB = "SELECT * FROM jobs WHERE job_id = ?"
+_SQL_SELECT_WORKER = "SELECT * FROM workers WHERE worker_id = ?"
+_SQL_MATCH_HISTORY = ("SELECT m.match_id, m.job_id, m.worker_id, m.match_score, m.match_date, j.title, w.name "
+                      "FROM matches m LEFT JOIN jobs j ON m.job_id=j.job_id LEFT JOIN workers w ON m.worker_id=w.worker_id "
+                      "ORDER BY m.match_date DESC LIMIT 50")
+_SQL_SEED_COUNTS = ("SELECT (SELECT COUNT(*) FROM farmers), (SELECT COUNT(*) FROM workers), "
+                    "(SELECT COUNT(*) FROM jobs)")
+_SQL_INSERT_FARMER = "INSERT INTO farmers (name, phone, location, email) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_WORKER = "INSERT INTO workers (name, phone, location, skills, available) VALUES (?, ?, ?, ?, ?)"
+_SQL_INSERT_JOB = ("INSERT INTO jobs (farmer_id, title, description, skill_required, location, duration, pay_rate) "
+                   "VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+@functools.lru_cache(maxsize=32)
+def _insert_matches_sql(n_rows: int) -> str:
+    return _SQL_INSERT_MATCHES + ",".join(["(?, ?, ?)"] * n_rows)
+
+# Prepped candidate lists shared by every engine, keyed by (db path, table) and
+# reused while the table's data_versions counter is unchanged. The cached rows
+# are shared, so callers must not modify the returned row dicts.
+_candidate_cache: Dict[Tuple[Optional[str], str], Tuple[int, Candidates]] = {}
+_candidate_cache_lock = threading.Lock()
+
 class MatchingEngine:
     def __init__(self, db_module=database):
         self.db = db_module
+        # Whether the matches table exists; without it results are simply not
+        # persisted. Probed on first save, since the engine may be built before
+        # init_database() runs, and re-probed until the table shows up.
+        self._has_matches = False
 
-    def _get_all_workers(self) -> List[Dict[str, Any]]:
-        return self.db.fetch_all("SELECT * FROM workers WHERE available=1")
-
-    def _get_all_jobs(self) -> List[Dict[str, Any]]:
-        return self.db.fetch_all("SELECT * FROM jobs WHERE status='open'")
+    def _save_matches(self, rows: List[Tuple[int, int, int]]):
+        """
+        Persist (job_id, worker_id, match_score) rows to the matches table.
+        A top-N result is written as one multi-row INSERT (one statement, one
+        commit) rather than N executions. Insert errors propagate.
+        """
+        if not rows:
+            return
+        if not self._has_matches:
+            self._has_matches = self.db.fetch_one(_SQL_HAS_MATCHES) is not None
+            if not self._has_matches:
+                return
+        with self.db.transaction():
+            for start in range(0, len(rows), _INSERT_MATCH_ROWS):
+                chunk = rows[start:start + _INSERT_MATCH_ROWS]
+                self.db.execute_query(_insert_matches_sql(len(chunk)), tuple(chain.from_iterable(chunk)))
+
+    def _cached_candidates(self, table: str, sql: str, build) -> Candidates:
+        """
+        Return the candidate columns built from `sql`, refetching only when
+        `table` has changed since they were cached.
+        """
+        version = self.db.table_version(table)
+        key = (getattr(self.db, "DB_PATH", None), table)
+        with _candidate_cache_lock:
+            cached = _candidate_cache.get(key)
+        if version is not None and cached is not None and cached[0] == version:
+            return cached[1]
+
+        candidates = build(self.db.fetch_all(sql))
+        if version is not None:
+            with _candidate_cache_lock:
+                _candidate_cache[key] = (version, candidates)
+        return candidates
+
+    def _get_all_workers(self) -> Candidates:
+        return self._cached_candidates(
+            "workers", _SQL_AVAILABLE_WORKERS,
+            lambda rows: Candidates.from_rows(rows, "skills", check_availability=True))
+
+    def _get_all_jobs(self) -> Candidates:
+        return self._cached_candidates(
+            "jobs", _SQL_OPEN_JOBS, lambda rows: Candidates.from_rows(rows, "skill_required"))
 
     def match_job_to_workers(self, job_row: Dict[str, Any], top_n: int = 10) -> List[Dict[str, Any]]:
         """
         Score available workers for the given job row (dict from DB).
         job_row expected fields: job_id, skill_required, location, max_distance (optional)
         """
+        top = self._rank_workers(prep_job(job_row), self._get_all_workers(), top_n)
+        # persist matches to DB matches table
+        self._save_matches([(job_row["job_id"], r["worker_id"], int(round(r["score"] * 100))) for r in top])
+        return top
+
+    def match_all_open_jobs(self, top_n: int = 10) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Match every open job to workers in one pass: each table is fetched once
+        and all matches are saved in a single transaction.
+        Returns {job_id: matches} with the same matches match_job_to_workers gives.
+        """
+        jobs = self._get_all_jobs()
         workers = self._get_all_workers()
-        scored = []
-        job_skills = [normalize_skill(s) for s in str(job_row.get("skill_required", "")).split(',') if s.strip()]
+        results = {}
+        rows = []
+        for i in range(len(jobs)):
+            job_id = jobs.rows[i]["job_id"]
+            top = results[job_id] = self._rank_workers(jobs.prepped(i), workers, top_n)
+            rows.extend((job_id, r["worker_id"], int(round(r["score"] * 100))) for r in top)
+        self._save_matches(rows)
+        return results
+
+    def _rank_workers(self, job: PreppedRow, workers: Candidates, top_n: int) -> List[Dict[str, Any]]:
+        """Top-N worker matches for one prepped job, without saving them."""
+        job_loc_str = job[0].get("location", "") or ""
+        distance = workers.distance_to(job[2])
+        locations = workers.locations
+
+        def proximity_of(i: int) -> float:
+            return proximity_score(distance(i), locations[i], job_loc_str)
+
+        required = job[1]
+        if required:
+            # Only workers sharing a required skill get a skill score; the rest
+            # score 0.0 and are only walked if ranking gets down to their bound
+            holders = workers.sharing_skills(required)
+            bits, n_required = workers.bits, popcount(required)
+            skill = [0.0] * len(workers)
+            for i in holders:
+                skill[i] = popcount(required & bits[i]) / n_required
+            groups = score_bounds(skill, workers.availability, holders)
+            for avail, members in workers.by_availability.items():
+                rest = (i for i in members if i not in holders)
+                bound = score_bound(0.0, avail)
+                groups[bound] = chain(groups[bound], rest) if bound in groups else rest
+        else:
+            skill = skill_scores(repeat(required), workers.bits)
+            groups = None
+
+        # Availability bonus (10% weight)
+        ranked = rank_candidates(skill, workers.availability, proximity_of, top_n, groups)
 
-        job_loc = parse_latlon(job_row.get("location", "") or "")
-        for w in workers:
-            score, reasons = self._score_match(job_skills, job_loc, job_row, w)
-            scored.append({
+        top = []
+        for i, score in ranked:
+            w = workers.rows[i]
+            note = "worker available" if workers.availability[i] else "worker not available"
+            top.append({
                 "worker_id": w["worker_id"],
                 "name": w["name"],
                 "skills": w["skills"],
                 "score": score,
-                "reasons": reasons,
+                "reasons": explain_match(job, workers.prepped(i), distance(i), proximity_of(i), score, note),
                 "worker_row": w
             })
-
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        top = scored[:top_n]
-        # persist matches to DB matches table
-        for r in top:
-            try:
-                self.db.execute_query(
-                    "INSERT INTO matches (job_id, worker_id, match_score) VALUES (?, ?, ?)",
-                    (job_row["job_id"], r["worker_id"], int(round(r["score"] * 100)))
-                )
-            except Exception:
-                # if matches table isn't present or insert fails, ignore gracefully
-                pass
         return top
 
     def match_worker_to_jobs(self, worker_row: Dict[str, Any], top_n: int = 10) -> List[Dict[str, Any]]:
+        worker = prep_worker(worker_row)
+        worker_loc_str = worker_row.get("location", "") or ""
         jobs = self._get_all_jobs()
-        scored = []
-        worker_skills = [normalize_skill(s) for s in str(worker_row.get("skills", "")).split(',') if s.strip()]
-        worker_loc = parse_latlon(worker_row.get("location", "") or "")
-        for j in jobs:
-            score, reasons = self._score_match(worker_skills, worker_loc, j, worker_row, inverse=True)
-            scored.append({
+        distance = jobs.distance_to(worker[2])
+        locations = jobs.locations
+
+        def proximity_of(i: int) -> float:
+            return proximity_score(distance(i), worker_loc_str, locations[i])
+
+        # The worker is the one asking for jobs, so full availability is assumed
+        ranked = rank_candidates(skill_scores(jobs.bits, repeat(worker[1])), jobs.availability,
+                                 proximity_of, top_n)
+
+        top = []
+        for i, score in ranked:
+            j = jobs.rows[i]
+            top.append({
                 "job_id": j["job_id"],
                 "title": j["title"],
                 "skill_required": j["skill_required"],
                 "score": score,
-                "reasons": reasons,
+                "reasons": explain_match(jobs.prepped(i), worker, distance(i), proximity_of(i), score),
                 "job_row": j
             })
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        top = scored[:top_n]
-        for r in top:
-            try:
-                self.db.execute_query(
-                    "INSERT INTO matches (job_id, worker_id, match_score) VALUES (?, ?, ?)",
-                    (r["job_id"], worker_row["worker_id"], int(round(r["score"] * 100)))
-                )
-            except Exception:
-                pass
+        self._save_matches([(r["job_id"], worker_row["worker_id"], int(round(r["score"] * 100))) for r in top])
         return top
 
-    def _score_match(self, job_skills: List[str], job_loc: Optional[Dict[str, float]], job_row: Dict[str, Any],
-                     worker_row: Dict[str, Any], inverse: bool=False) -> Tuple[float, List[str]]:
-        """
-        Compute a score 0..1 for job vs worker.
-        If inverse=False: job_skills param corresponds to job required skills (list), worker_row contains worker.
-        If inverse=True: job_skills param is worker skills and job_row is job.
-        """
-        reasons = []
-        # Extract skill lists appropriately
-        if inverse:
-            # job_skills are actually worker skills; job_row.skill_required is job requirements
-            worker_skills = job_skills
-            job_required = [normalize_skill(s) for s in str(job_row.get("skill_required", "")).split(',') if s.strip()]
-        else:
-            job_required = job_skills
-            worker_skills = [normalize_skill(s) for s in str(worker_row.get("skills", "")).split(',') if s.strip()]
-
-        # Skill score
-        if not job_required:
-            skill_score = 0.5
-            reasons.append("no required skills (neutral)")
-        else:
-            matched = set(job_required) & set(worker_skills)
-            skill_score = len(matched) / len(job_required)
-            reasons.append(f"skills matched {len(matched)}/{len(job_required)}")
-
-        # Proximity score - try lat/lon first, fall back to text matching
-        prox_score = 0.5  # neutral default when no location info
-        worker_loc_str = worker_row.get("location", "") or ""
-        job_loc_str = job_row.get("location", "") or ""
-        
-        # Try to parse as lat/lon coordinates
-        worker_loc = parse_latlon(worker_loc_str)
-        job_loc_parsed = job_loc if job_loc is not None else parse_latlon(job_loc_str)
-        
-        if worker_loc and job_loc_parsed:
-            # Both have valid lat/lon coordinates - use distance calculation
-            try:
-                dist = haversine_km(worker_loc, job_loc_parsed)
-                reasons.append(f"distance {dist:.1f}km")
-                # Use a soft scale: <10km -> 1.0, 10-100 -> linear, >100 -> 0
-                if dist <= 10:
-                    prox_score = 1.0
-                elif dist <= 100:
-                    prox_score = 1 - ((dist - 10) / 90)  # 1 down to 0
-                else:
-                    prox_score = 0.0
-                reasons.append(f"proximity_score {prox_score:.2f}")
-            except Exception:
-                reasons.append("proximity calc failed")
-                prox_score = 0.5
-        elif worker_loc_str and job_loc_str:
-            # Fall back to text-based location matching
-            prox_score = match_location_text(worker_loc_str, job_loc_str)
-            reasons.append(f"location text match: {prox_score:.2f}")
-        else:
-            reasons.append("no location info (proximity neutral)")
-
-        # Simple metadata bonus from worker rating if present in metadata column (not guaranteed)
-        bonus = 0.0
-        try:
-            # If the workers table had a JSON metadata, the earlier DB doesn't; ignore for now
-            pass
-        except Exception:
-            pass
-
-        # Availability bonus (10% weight)
-        availability_bonus = 0.0
-        if not inverse:
-            # When matching workers to jobs, check worker availability
-            if worker_row.get("available", 0):
-                availability_bonus = 1.0
-                reasons.append("worker available")
-            else:
-                availability_bonus = 0.0
-                reasons.append("worker not available")
-        else:
-            # When matching jobs to workers, availability is already filtered
-            availability_bonus = 1.0
-        
-        # Compose weighted score (60% skill, 30% location, 10% availability)
-        w_skill, w_prox, w_avail = 0.60, 0.30, 0.10
-        score = (skill_score * w_skill) + (prox_score * w_prox) + (availability_bonus * w_avail)
-        score = max(0.0, min(1.0, score))
-        reasons.append(f"final_score {score:.3f}")
-        return score, reasons
-
 
 def match_workers_to_job(job_id: int, top_n: int = 10):
     """
     Convenience function used by main.py to find and display workers for a given job.
     """
-    job = database.fetch_one("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+    job = database.fetch_one(_SQL_SELECT_JOB, (job_id,))
     if not job:
         print(f"No job found with ID {job_id}.")
         return
@@ -276,7 +561,7 @@ def match_jobs_to_worker(worker_id: int, top_n: int = 10):
     """
     Convenience function used by main.py to find and display jobs for a given worker.
     """
-    worker = database.fetch_one("SELECT * FROM workers WHERE worker_id = ?", (worker_id,))
+    worker = database.fetch_one(_SQL_SELECT_WORKER, (worker_id,))
     if not worker:
         print(f"No worker found with ID {worker_id}.")
         return
@@ -309,7 +594,7 @@ def display_job_matches(job_row: Dict[str, Any], matches: List[Dict[str, Any]]):
     print("\n" + "=" * 80)
     print(f"Matches for Job ID {job_row.get('job_id')}: {job_row.get('title', 'N/A')}")
     print("=" * 80 + "\n")
-    print(tabulate(rows, headers=headers, tablefmt="grid"))
+    print_table(rows, headers)
     print()
 
 def display_worker_matches(worker_row: Dict[str, Any], matches: List[Dict[str, Any]]):
@@ -333,7 +618,7 @@ def display_worker_matches(worker_row: Dict[str, Any], matches: List[Dict[str, A
     print("\n" + "=" * 80)
     print(f"Matches for Worker ID {worker_row.get('worker_id')}: {worker_row.get('name', 'N/A')}")
     print("=" * 80 + "\n")
-    print(tabulate(rows, headers=headers, tablefmt="grid"))
+    print_table(rows, headers)
     print()
 
 # ----------------------------- CLI / Demo --------------------------------
@@ -342,27 +627,26 @@ def demo(engine: MatchingEngine):
     # Ensure DB exists and get some entries; if no data, create some demo rows
     engine.db.init_database()
 
-    # Create demo farmer, jobs and workers if not present
-    farmers = engine.db.fetch_all("SELECT * FROM farmers")
-    if not farmers:
-        engine.db.execute_query("INSERT INTO farmers (name, phone, location, email) VALUES (?, ?, ?, ?)",
-                                ("Demo Farmer", "+250788000000", "-1.95,30.06", "farmer@example.com"))
-    workers = engine.db.fetch_all("SELECT * FROM workers")
-    if not workers:
-        engine.db.execute_query("INSERT INTO workers (name, phone, location, skills, available) VALUES (?, ?, ?, ?, ?)",
-                                ("Alice", "+250788111111", "-1.95,30.06", "React,JavaScript", 1))
-        engine.db.execute_query("INSERT INTO workers (name, phone, location, skills, available) VALUES (?, ?, ?, ?, ?)",
-                                ("Bob", "+250788222222", "-2.05,30.01", "Excel,Data entry", 1))
-        engine.db.execute_query("INSERT INTO workers (name, phone, location, skills, available) VALUES (?, ?, ?, ?, ?)",
-                                ("Carlos", "+250788333333", "", "GPS,Surveying", 1))
-
-    jobs = engine.db.fetch_all("SELECT * FROM jobs")
-    if not jobs:
-        # farmer_id 1 assumed from insertion above
-        engine.db.execute_query("INSERT INTO jobs (farmer_id, title, description, skill_required, location, duration, pay_rate) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                                (1, "Front-end dev", "Short React build", "React,JavaScript", "-1.9441,30.0619", "2 days", "$30/day"))
-        engine.db.execute_query("INSERT INTO jobs (farmer_id, title, description, skill_required, location, duration, pay_rate) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                                (1, "Data entry", "Record harvest data", "Excel", "-1.95,30.06", "1 day", "$10/day"))
+    # Create demo farmer, jobs and workers if not present: one probe for all
+    # three tables, then every seed row in a single transaction
+    n_farmers, n_workers, n_jobs = engine.db.fetch_all_tuples(_SQL_SEED_COUNTS)[0]
+    if not (n_farmers and n_workers and n_jobs):
+        with engine.db.transaction() as conn:
+            if not n_farmers:
+                conn.execute(_SQL_INSERT_FARMER,
+                             ("Demo Farmer", "+250788000000", "-1.95,30.06", "farmer@example.com"))
+            if not n_workers:
+                conn.executemany(_SQL_INSERT_WORKER, [
+                    ("Alice", "+250788111111", "-1.95,30.06", "React,JavaScript", 1),
+                    ("Bob", "+250788222222", "-2.05,30.01", "Excel,Data entry", 1),
+                    ("Carlos", "+250788333333", "", "GPS,Surveying", 1),
+                ])
+            if not n_jobs:
+                # farmer_id 1 assumed from insertion above
+                conn.executemany(_SQL_INSERT_JOB, [
+                    (1, "Front-end dev", "Short React build", "React,JavaScript", "-1.9441,30.0619", "2 days", "$30/day"),
+                    (1, "Data entry", "Record harvest data", "Excel", "-1.95,30.06", "1 day", "$10/day"),
+                ])
 
     # Pick first job and first worker for demo matching
     job = engine.db.fetch_all("SELECT * FROM jobs LIMIT 1")[0]
@@ -378,12 +662,12 @@ def demo(engine: MatchingEngine):
 def show_history():
     # Show last 50 matches saved in DB
     database.init_database()
-    rows = database.fetch_all("SELECT m.match_id, m.job_id, m.worker_id, m.match_score, m.match_date, j.title, w.name FROM matches m LEFT JOIN jobs j ON m.job_id=j.job_id LEFT JOIN workers w ON m.worker_id=w.worker_id ORDER BY m.match_date DESC LIMIT 50")
+    # Columns are selected in display order, so the tuples go straight to the table
+    rows = database.fetch_all_tuples(_SQL_MATCH_HISTORY)
     if not rows:
         print("No match history.")
         return
-    print(tabulate([[r["match_id"], r["job_id"], r["worker_id"], r["match_score"], r["match_date"], r["title"], r["name"]] for r in rows],
-                   headers=["match_id", "job_id", "worker_id", "score", "date", "job_title", "worker_name"], tablefmt="grid"))
+    print_table(rows, headers=["match_id", "job_id", "worker_id", "score", "date", "job_title", "worker_name"])
 
 def parse_args(argv: List[str]):
     p = argparse.ArgumentParser(description="Matching engine CLI")
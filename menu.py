@@ -1,101 +1,124 @@
 
 
-from utils import clear_screen, print_header, print_separator, print_error
+import sys
+
+from utils import clear_screen, format_header, SEPARATOR, print_error
+
+
+def _menu_text(heading, options):
+    """
+    Build a menu block: heading, separator, numbered options, separator.
+    
+    Args:
+        heading (str): Line shown above the options
+        options (tuple): Option labels, numbered from 1
+        
+    Returns:
+        str: Menu text ending in a newline
+    """
+    lines = [heading, SEPARATOR]
+    lines.extend(f"[{number}] {label}" for number, label in enumerate(options, 1))
+    lines.append(SEPARATOR)
+    return "\n".join(lines) + "\n"
+
+
+# Menu bodies never change, so they are rendered once at import
+_MAIN_MENU = _menu_text("MAIN MENU", (
+    "Register as Farmer",
+    "Register as Worker",
+    "Login as Farmer",
+    "Login as Worker",
+    "View Available Jobs",
+    "Search Jobs by Location",
+    "Exit",
+))
+_FARMER_MENU = _menu_text("FARMER MENU", (
+    "View My Profile",
+    "Post a New Job",
+    "View My Posted Jobs",
+    "Find Workers for a Job",
+    "Update Job Status",
+    "Delete a Job",
+    "Back to Main Menu",
+))
+_WORKER_MENU = _menu_text("WORKER MENU", (
+    "View My Profile",
+    "Update My Skills",
+    "Update Availability Status",
+    "View All Available Jobs",
+    "Find Jobs Matching My Skills",
+    "Search Jobs by Location",
+    "Back to Main Menu",
+))
+_JOB_STATUS_MENU = "\n" + _menu_text("Select new job status:", ("Open", "Filled", "Closed"))
+
+
+def _show_screen(title, body):
+    """
+    Clear the screen and draw a header plus body with a single write.
+    
+    Args:
+        title (str): Header title
+        body (str): Text shown below the header
+    """
+    clear_screen()
+    sys.stdout.write(format_header(title) + "\n" + body)
+    sys.stdout.flush()
 
 
 def display_main_menu():
     
-    clear_screen()
-    print_header("Local Agricultural Job Board & Skills Match making system")
-    
-    print("MAIN MENU")
-    print_separator()
-    print("[1] Register as Farmer")
-    print("[2] Register as Worker")
-    print("[3] Login as Farmer")
-    print("[4] Login as Worker")
-    print("[5] View Available Jobs")
-    print("[6] Search Jobs by Location")
-    print("[7] Exit")
-    print_separator()
+    _show_screen("Local Agricultural Job Board & Skills Match making system", _MAIN_MENU)
     
     return get_user_choice(1, 7)
 
 
 def display_farmer_menu(farmer_name):
     
-    clear_screen()
-    print_header(f"Farmer Dashboard - Welcome, {farmer_name}!")
-    
-    print("FARMER MENU")
-    print_separator()
-    print("[1] View My Profile")
-    print("[2] Post a New Job")
-    print("[3] View My Posted Jobs")
-    print("[4] Find Workers for a Job")
-    print("[5] Update Job Status")
-    print("[6] Delete a Job")
-    print("[7] Back to Main Menu")
-    print_separator()
+    _show_screen(f"Farmer Dashboard - Welcome, {farmer_name}!", _FARMER_MENU)
     
     return get_user_choice(1, 7)
 
 
 def display_worker_menu(worker_name):
    
-    clear_screen()
-    print_header(f"Worker Dashboard - Welcome, {worker_name}!")
-    
-    print("WORKER MENU")
-    print_separator()
-    print("[1] View My Profile")
-    print("[2] Update My Skills")
-    print("[3] Update Availability Status")
-    print("[4] View All Available Jobs")
-    print("[5] Find Jobs Matching My Skills")
-    print("[6] Search Jobs by Location")
-    print("[7] Back to Main Menu")
-    print_separator()
+    _show_screen(f"Worker Dashboard - Welcome, {worker_name}!", _WORKER_MENU)
     
     return get_user_choice(1, 7)
 
 
 def display_login_menu(user_type):
     
-    clear_screen()
-    print_header(f"{user_type.capitalize()} Login")
-    
-    print(f"Please select a {user_type} to continue:")
-    print_separator()
+    _show_screen(f"{user_type.capitalize()} Login",
+                 f"Please select a {user_type} to continue:\n{SEPARATOR}\n")
     
     return None  
 
 
 def get_user_choice(min_option, max_option):
     
+    prompt = f"\nEnter your choice ({min_option}-{max_option}): "
     while True:
         try:
-            choice = int(input(f"\nEnter your choice ({min_option}-{max_option}): "))
-            
-            if min_option <= choice <= max_option:
-                return choice
-            else:
-                print_error(f"Please enter a number between {min_option} and {max_option}.")
-        except ValueError:
-            print_error("Invalid input. Please enter a number.")
+            raw = input(prompt).strip()
         except KeyboardInterrupt:
             print("\n\nExiting program...")
             exit(0)
+        
+        # Menu options are never negative, so anything but plain digits is invalid
+        if not raw.isdecimal():
+            print_error("Invalid input. Please enter a number.")
+            continue
+        
+        choice = int(raw)
+        if min_option <= choice <= max_option:
+            return choice
+        print_error(f"Please enter a number between {min_option} and {max_option}.")
 
 
 def display_job_status_menu():
     
-    print("\nSelect new job status:")
-    print_separator()
-    print("[1] Open")
-    print("[2] Filled")
-    print("[3] Closed")
-    print_separator()
+    sys.stdout.write(_JOB_STATUS_MENU)
     
     choice = get_user_choice(1, 3)
     
@@ -108,26 +131,30 @@ def display_job_status_menu():
     return status_map[choice]
 
 
+_WELCOME_TEXT = "\n".join([
+    "\n",
+    "=" * 60,
+    "  WELCOME TO LOCAL AGRICULTURAL JOB BOARD",
+    "  Connecting Farmers with Skilled Agricultural Workers",
+    "=" * 60,
+    "\n  This system helps:",
+    "  • Farmers find qualified workers for their farms",
+    "  • Workers discover job opportunities in agriculture",
+    "  • Match jobs with workers based on skills and location",
+    "\n" + "=" * 60 + "\n",
+]) + "\n"
+
+
 def display_welcome_message():
    
     clear_screen()
-    print("\n")
-    print("=" * 60)
-    print("  WELCOME TO LOCAL AGRICULTURAL JOB BOARD")
-    print("  Connecting Farmers with Skilled Agricultural Workers")
-    print("=" * 60)
-    print("\n  This system helps:")
-    print("  • Farmers find qualified workers for their farms")
-    print("  • Workers discover job opportunities in agriculture")
-    print("  • Match jobs with workers based on skills and location")
-    print("\n" + "=" * 60 + "\n")
+    sys.stdout.write(_WELCOME_TEXT)
     input("Press Enter to continue...")
 
 
 def display_exit_message():
     
-    clear_screen()
-    print_header("Thank You!")
-    print("Thank you for using the Agricultural Job Board.")
-    print("Helping farmers and workers connect for a better harvest!")
-    print("\nGoodbye! \n")
\ No newline at end of file
+    _show_screen("Thank You!",
+                 "Thank you for using the Agricultural Job Board.\n"
+                 "Helping farmers and workers connect for a better harvest!\n"
+                 "\nGoodbye! \n\n")
\ No newline at end of file
@@ -5,10 +5,25 @@ This module provides data validation functions and model classes for the applica
 Owner: Modupe Adegoke Akanni
 """
 
+import functools
 import re
+import sys
 from datetime import datetime
 
 
+# Phone formatting characters are deleted with str.translate rather than a
+# regex. The whitespace set is what \s matches (str.isspace(); U+3000 is the
+# highest such code point)
+_PHONE_STRIP_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(0x3001)) if c.isspace()
+) + '-()+')
+
+# Email pattern, compiled once at import. Used with fullmatch(): unlike a
+# trailing $, it can't stop before a final newline, and the length cap in
+# validate_email() bounds backtracking
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+
 def validate_phone(phone):
     """
     Validate phone number format.
@@ -29,11 +44,22 @@ def validate_phone(phone):
     if not phone or not isinstance(phone, str):
         return False
     
+    return _validate_phone_cached(phone)
+
+
+# Phone and email checks are memoized: the same handful of strings are
+# re-validated by every model validate() call, and a cache hit is several
+# times cheaper than the translate pass or the regex. Only non-empty strings
+# reach here, so every key is hashable.
+@functools.lru_cache(maxsize=1024)
+def _validate_phone_cached(phone):
+    """Check a non-empty phone string; see validate_phone()."""
     # Remove common formatting characters
-    cleaned = re.sub(r'[\s\-\(\)\+]', '', phone)
+    cleaned = phone.translate(_PHONE_STRIP_TABLE)
     
-    # Check if remaining characters are all digits
-    if not cleaned.isdigit():
+    # Check if remaining characters are all ASCII digits; isdigit() alone also
+    # accepts superscripts and other scripts' digits
+    if not (cleaned.isascii() and cleaned.isdigit()):
         return False
     
     # Check length (minimum 10 digits, maximum 15 for international)
@@ -56,10 +82,21 @@ def validate_email(email):
     if not email or not isinstance(email, str):
         return False
     
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return _validate_email_cached(email)
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_email_cached(email):
+    """Check a non-empty email string; see validate_email()."""
+    email = email.strip()
+    
+    # Cheap rejects before the regex: shortest valid form is "a@b.cc", 254
+    # characters is the longest address SMTP allows, and the pattern admits
+    # exactly one '@'
+    if len(email) < 6 or len(email) > 254 or email.count('@') != 1 or '.' not in email:
+        return False
     
-    return bool(re.match(pattern, email.strip()))
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def validate_location(location):
@@ -77,23 +114,68 @@ def validate_location(location):
     if not location or not isinstance(location, str):
         return False
     
-    # Trim whitespace
-    location = location.strip()
+    # Blank after trimming whitespace
+    if location.isspace():
+        return False
     
-    # Check if not empty and reasonable length
-    if len(location) == 0 or len(location) > 200:
+    # Too long even after trimming; only long inputs pay for the stripped copy
+    if len(location) > 200 and len(location.strip()) > 200:
         return False
     
     return True
 
 
-class Farmer:
+def _intern(value):
+    """
+    Intern a string field so repeated values share one object.
+    
+    Statuses and location names repeat across many records; interned copies
+    compare by identity first and are stored once. Non-strings pass through.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+class _Record:
+    """
+    Equality and hashing by database ID, shared by the model classes.
+    
+    Two saved records of the same class are equal when their IDs match, so
+    sets and dicts deduplicate them. Unsaved records (ID None) only equal
+    themselves; their hash changes once an ID is assigned, so don't put them
+    in a set or dict before saving.
+    """
+    
+    __slots__ = ()
+    
+    # Name of the ID attribute, set by each subclass
+    _ID_FIELD = None
+    
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        record_id = getattr(self, self._ID_FIELD)
+        if record_id is None:
+            return self is other
+        return record_id == getattr(other, self._ID_FIELD)
+    
+    def __hash__(self):
+        record_id = getattr(self, self._ID_FIELD)
+        if record_id is None:
+            return object.__hash__(self)
+        return hash((type(self).__name__, record_id))
+
+
+class Farmer(_Record):
     """
     Farmer data model class.
     
     Represents a farmer who can post jobs.
     """
     
+    # Fixed attribute slots: no per-instance __dict__
+    __slots__ = ('farmer_id', 'name', 'phone', 'location', 'email', 'registration_date')
+    _ID_FIELD = 'farmer_id'
+    
     def __init__(self, name, phone, location, email=None, farmer_id=None, registration_date=None):
         """
         Initialize Farmer instance.
@@ -109,7 +191,7 @@ class Farmer:
         self.farmer_id = farmer_id
         self.name = name
         self.phone = phone
-        self.location = location
+        self.location = _intern(location)
         self.email = email
         self.registration_date = registration_date
     
@@ -126,7 +208,10 @@ class Farmer:
         if not validate_phone(self.phone):
             return False, "Invalid phone number format"
         
-        if not validate_location(self.location):
+        # validate_location() inlined: non-empty after stripping, at most 200 chars
+        location = self.location
+        if (not isinstance(location, str) or not location or location.isspace()
+                or (len(location) > 200 and len(location.strip()) > 200)):
             return False, "Invalid location"
         
         if self.email and not validate_email(self.email):
@@ -154,13 +239,17 @@ class Farmer:
         return f"Farmer(id={self.farmer_id}, name='{self.name}', location='{self.location}')"
 
 
-class Worker:
+class Worker(_Record):
     """
     Worker data model class.
     
     Represents a worker who can be matched to jobs.
     """
     
+    __slots__ = ('worker_id', 'name', 'phone', 'location', '_skills', 'available', 'registration_date',
+                 '_skills_cache', '_skills_lower_set')
+    _ID_FIELD = 'worker_id'
+    
     def __init__(self, name, phone, location, skills, available=True, worker_id=None, registration_date=None):
         """
         Initialize Worker instance.
@@ -177,11 +266,23 @@ class Worker:
         self.worker_id = worker_id
         self.name = name
         self.phone = phone
-        self.location = location
+        self.location = _intern(location)
         self.skills = skills
         self.available = available
         self.registration_date = registration_date
     
+    @property
+    def skills(self):
+        """Comma-separated skills string."""
+        return self._skills
+    
+    @skills.setter
+    def skills(self, value):
+        # Parsed forms are derived lazily and dropped whenever skills changes
+        self._skills = value
+        self._skills_cache = None
+        self._skills_lower_set = None
+    
     def validate(self):
         """
         Validate worker data.
@@ -195,7 +296,10 @@ class Worker:
         if not validate_phone(self.phone):
             return False, "Invalid phone number format"
         
-        if not validate_location(self.location):
+        # validate_location() inlined: non-empty after stripping, at most 200 chars
+        location = self.location
+        if (not isinstance(location, str) or not location or location.isspace()
+                or (len(location) > 200 and len(location.strip()) > 200)):
             return False, "Invalid location"
         
         if not self.skills or len(self.skills.strip()) == 0:
@@ -210,9 +314,13 @@ class Worker:
         Returns:
             list: List of skill strings
         """
-        if not self.skills:
-            return []
-        return [skill.strip() for skill in self.skills.split(',') if skill.strip()]
+        if self._skills_cache is None:
+            if not self.skills:
+                self._skills_cache = ()
+            else:
+                # One strip per token; filter(None, ...) drops the empty ones
+                self._skills_cache = tuple(filter(None, (skill.strip() for skill in self.skills.split(','))))
+        return list(self._skills_cache)
     
     def has_skill(self, skill):
         """
@@ -224,8 +332,22 @@ class Worker:
         Returns:
             bool: True if worker has the skill
         """
-        skills_list = self.get_skills_list()
-        return skill.lower().strip() in [s.lower() for s in skills_list]
+        return skill.lower().strip() in self.skill_set
+    
+    @property
+    def skill_set(self):
+        """
+        Normalized (stripped, lowercase) skills as a frozenset.
+        
+        Computed once per skills value, for membership tests and set
+        intersections between workers and jobs.
+        
+        Returns:
+            frozenset: Lowercase skill strings
+        """
+        if self._skills_lower_set is None:
+            self._skills_lower_set = frozenset(s.lower() for s in self.get_skills_list())
+        return self._skills_lower_set
     
     def to_dict(self):
         """
@@ -248,13 +370,20 @@ class Worker:
         return f"Worker(id={self.worker_id}, name='{self.name}', location='{self.location}', available={self.available})"
 
 
-class Job:
+class Job(_Record):
     """
     Job data model class.
     
     Represents a job posting by a farmer.
     """
     
+    __slots__ = ('job_id', 'farmer_id', 'title', 'description', 'skill_required', 'location',
+                 'duration', 'pay_rate', 'status', 'posted_date')
+    _ID_FIELD = 'job_id'
+    
+    # Allowed job statuses, shared with job_management
+    VALID_STATUSES = frozenset(('open', 'filled', 'closed'))
+    
     def __init__(self, farmer_id, title, skill_required, location, description=None, 
                  duration=None, pay_rate=None, status='open', job_id=None, posted_date=None):
         """
@@ -277,10 +406,10 @@ class Job:
         self.title = title
         self.description = description
         self.skill_required = skill_required
-        self.location = location
+        self.location = _intern(location)
         self.duration = duration
         self.pay_rate = pay_rate
-        self.status = status
+        self.status = _intern(status)
         self.posted_date = posted_date
     
     def validate(self):
@@ -299,10 +428,13 @@ class Job:
         if not self.skill_required or len(self.skill_required.strip()) == 0:
             return False, "Required skill is needed"
         
-        if not validate_location(self.location):
+        # validate_location() inlined: non-empty after stripping, at most 200 chars
+        location = self.location
+        if (not isinstance(location, str) or not location or location.isspace()
+                or (len(location) > 200 and len(location.strip()) > 200)):
             return False, "Invalid location"
         
-        if self.status not in ['open', 'filled', 'closed']:
+        if self.status not in Job.VALID_STATUSES:
             return False, "Status must be 'open', 'filled', or 'closed'"
         
         return True, None
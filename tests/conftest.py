@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for the test suite.
+
+Puts the project root on sys.path once so every test module can import the
+application modules directly.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
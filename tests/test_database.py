@@ -11,9 +11,6 @@ import tempfile
 import shutil
 from unittest.mock import patch
 
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import database
 
 
@@ -30,6 +27,8 @@ class TestDatabase(unittest.TestCase):
     
     def tearDown(self):
         """Clean up after tests."""
+        # Close pooled connections to the test database before deleting it
+        database.close_all()
         # Restore original database path
         database.DB_PATH = self.original_db_path
         database.DB_DIR = "data"
@@ -67,6 +66,55 @@ class TestDatabase(unittest.TestCase):
         self.assertIn('jobs', tables)
         self.assertIn('matches', tables)
     
+    def test_init_database_creates_indexes(self):
+        """Test that init_database creates the job lookup indexes."""
+        database.init_database()
+        
+        indexes = [row['name'] for row in database.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='jobs'"
+        )]
+        
+        for name in ('idx_jobs_farmer', 'idx_jobs_status_farmer',
+                     'idx_jobs_location_nocase', 'idx_jobs_skill_nocase'):
+            self.assertIn(name, indexes)
+        
+        worker_indexes = [row['name'] for row in database.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='workers'"
+        )]
+        self.assertIn('idx_workers_available', worker_indexes)
+    
+    def test_jobs_fts_tracks_job_changes(self):
+        """Test that the full-text index follows inserts, updates and deletes on jobs."""
+        database.init_database()
+        database.execute_query(
+            "INSERT INTO jobs (farmer_id, title, skill_required, location) VALUES (?, ?, ?, ?)",
+            (1, "Maize Picker", "Harvesting", "Kigali")
+        )
+        query = "SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?"
+        
+        self.assertEqual(len(database.fetch_all(query, ('skill_required : "harvest"*',))), 1)
+        
+        database.execute_query("UPDATE jobs SET title = 'Tea Picker'")
+        self.assertEqual(database.fetch_all(query, ('title : maize',)), [])
+        self.assertEqual(len(database.fetch_all(query, ('title : tea',))), 1)
+        
+        database.execute_query("DELETE FROM jobs")
+        self.assertEqual(database.fetch_all(query, ('title : tea',)), [])
+    
+    def test_init_database_records_schema_version(self):
+        """Test that init_database stamps user_version and skips setup once it matches."""
+        database.init_database()
+        self.assertEqual(
+            database.fetch_one("PRAGMA user_version")['user_version'], database.SCHEMA_VERSION
+        )
+        
+        # A current database must not be touched again, so a dropped index stays dropped
+        database.execute_query("DROP INDEX idx_jobs_farmer")
+        self.assertTrue(database.init_database())
+        self.assertIsNone(database.fetch_one(
+            "SELECT name FROM sqlite_master WHERE name = 'idx_jobs_farmer'"
+        ))
+    
     def test_get_connection(self):
         """Test that get_connection returns a valid connection."""
         database.init_database()
@@ -98,6 +146,54 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(row['name'], "Test Farmer")
         self.assertEqual(row['phone'], "1234567890")
     
+    def test_get_connection_uses_wal(self):
+        """Test that connections run in WAL journal mode."""
+        database.init_database()
+        conn = database.get_connection()
+        
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.close()
+        
+        self.assertEqual(journal_mode, "wal")
+        self.assertEqual(synchronous, 1)  # NORMAL
+    
+    def test_connection_is_reused(self):
+        """Test that connection() hands the same pooled connection back out."""
+        database.init_database()
+        
+        with database.connection() as first:
+            pass
+        with database.connection() as second:
+            pass
+        
+        self.assertIs(first, second)
+    
+    def test_pool_drained_when_db_path_changes(self):
+        """Test that pooled connections are not reused for another database."""
+        database.init_database()
+        with database.connection() as first:
+            pass
+        
+        database.DB_PATH = os.path.join(self.test_dir, "other_agri_jobs.db")
+        with database.connection() as second:
+            pass
+        
+        self.assertIsNot(first, second)
+    
+    def test_close_all_closes_idle_connections(self):
+        """Test that close_all closes pooled connections so new ones are opened."""
+        database.init_database()
+        with database.connection() as first:
+            pass
+        
+        database.close_all()
+        
+        with self.assertRaises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+        with database.connection() as second:
+            self.assertIsNot(first, second)
+    
     def test_execute_query(self):
         """Test execute_query function."""
         database.init_database()
@@ -121,11 +217,10 @@ class TestDatabase(unittest.TestCase):
         database.init_database()
         
         # Insert multiple records
-        for i in range(3):
-            database.execute_query("""
-                INSERT INTO farmers (name, phone, location)
-                VALUES (?, ?, ?)
-            """, (f"Farmer {i}", f"123456789{i}", f"Location {i}"))
+        database.execute_many("""
+            INSERT INTO farmers (name, phone, location)
+            VALUES (?, ?, ?)
+        """, [(f"Farmer {i}", f"123456789{i}", f"Location {i}") for i in range(3)])
         
         # Fetch all
         results = database.fetch_all("SELECT * FROM farmers ORDER BY name")
@@ -134,6 +229,33 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(results[0]['name'], "Farmer 0")
         self.assertEqual(results[2]['name'], "Farmer 2")
     
+    def test_execute_many(self):
+        """Test execute_many inserts every parameter tuple."""
+        database.init_database()
+        
+        database.execute_many(
+            "INSERT INTO farmers (name, phone, location) VALUES (?, ?, ?)",
+            [(f"Farmer {i}", f"123456789{i}", f"Location {i}") for i in range(3)]
+        )
+        
+        results = database.fetch_all("SELECT * FROM farmers")
+        self.assertEqual(len(results), 3)
+    
+    def test_transaction_rolls_back_on_error(self):
+        """Test that a failing transaction block discards all of its writes."""
+        database.init_database()
+        
+        with self.assertRaises(RuntimeError):
+            with database.transaction():
+                database.execute_query(
+                    "INSERT INTO farmers (name, phone, location) VALUES (?, ?, ?)",
+                    ("Test Farmer", "1234567890", "Test Location")
+                )
+                raise RuntimeError("abort")
+        
+        results = database.fetch_all("SELECT * FROM farmers")
+        self.assertEqual(results, [])
+    
     def test_fetch_one(self):
         """Test fetch_one function."""
         database.init_database()
@@ -175,7 +297,48 @@ class TestDatabase(unittest.TestCase):
         self.assertIn('name', results[0])
         self.assertIn('phone', results[0])
 
+    
+    def test_fetch_all_rows_returns_rows(self):
+        """Test that fetch_all_rows returns Row objects with name and index access."""
+        database.init_database()
+        
+        database.execute_query("""
+            INSERT INTO farmers (name, phone, location)
+            VALUES (?, ?, ?)
+        """, ("Test Farmer", "1234567890", "Test Location"))
+        
+        results = database.fetch_all_rows("SELECT name, phone FROM farmers")
+        
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0], sqlite3.Row)
+        self.assertEqual(results[0]['name'], "Test Farmer")
+        self.assertEqual(tuple(results[0]), ("Test Farmer", "1234567890"))
 
-if __name__ == '__main__':
-    unittest.main()
-
+    
+    def test_fetch_all_tuples_returns_tuples(self):
+        """Test that fetch_all_tuples returns plain tuples without changing other reads."""
+        database.init_database()
+        
+        database.execute_query("""
+            INSERT INTO farmers (name, phone, location)
+            VALUES (?, ?, ?)
+        """, ("Test Farmer", "1234567890", "Test Location"))
+        
+        results = database.fetch_all_tuples("SELECT name, phone FROM farmers")
+        
+        self.assertEqual(results, [("Test Farmer", "1234567890")])
+        self.assertEqual(database.fetch_one("SELECT name FROM farmers")['name'], "Test Farmer")
+    
+    def test_fetch_helpers_share_cursor(self):
+        """Test that pooled connections reuse one cursor and restore its row factory."""
+        database.init_database()
+        conn = database.get_connection()
+        cursor = conn.shared_cursor()
+        self.assertIs(conn.shared_cursor(), cursor)
+        database.return_connection(conn)
+        
+        database.fetch_all_tuples("SELECT 1 AS one")
+        rows = database.fetch_all_rows("SELECT 1 AS one")
+        
+        self.assertEqual(rows[0]['one'], 1)
+        self.assertIs(cursor.row_factory, sqlite3.Row)
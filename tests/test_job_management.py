@@ -5,14 +5,16 @@ Tests job posting, viewing, searching, and management functions.
 """
 
 import unittest
-import sys
 import os
 import tempfile
 import shutil
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import io
+import contextlib
+from unittest import mock
 
 import database
+import job_management
+import main
 from models import Job
 
 
@@ -38,6 +40,8 @@ class TestJobManagement(unittest.TestCase):
     
     def tearDown(self):
         """Clean up after tests."""
+        # Close pooled connections to the test database before deleting it
+        database.close_all()
         # Restore original database path
         database.DB_PATH = self.original_db_path
         database.DB_DIR = "data"
@@ -82,18 +86,73 @@ class TestJobManagement(unittest.TestCase):
         self.assertEqual(result['skill_required'], "Planting")
         self.assertEqual(result['status'], "open")
     
+    def test_post_job_from_dict(self):
+        """Test posting a job from a dictionary of submitted fields."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        
+        job_id = job_management.post_job_from_dict(farmer['farmer_id'], {
+            'title': "  Harvest Helper ",
+            'skill_required': "Harvesting",
+            'location': "Test Location",
+            'duration': "",
+        })
+        
+        result = database.fetch_one("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+        self.assertEqual(result['title'], "Harvest Helper")
+        self.assertIsNone(result['duration'])
+        self.assertEqual(result['status'], "open")
+    
+    def test_post_job_from_dict_missing_title(self):
+        """Test that a job without a title is rejected."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        
+        job_id = job_management.post_job_from_dict(farmer['farmer_id'], {
+            'skill_required': "Harvesting",
+            'location': "Test Location",
+        })
+        
+        self.assertIsNone(job_id)
+    
+    def test_post_jobs_bulk(self):
+        """Test that bulk posting inserts every job and returns their IDs."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        jobs = [
+            Job(farmer_id=farmer['farmer_id'], title=f"Bulk Job {i}",
+                skill_required="Planting", location=f"Location {i}")
+            for i in range(3)
+        ]
+        
+        job_ids = job_management.post_jobs_bulk(jobs)
+        
+        self.assertEqual(len(job_ids), 3)
+        for job_id, job in zip(job_ids, jobs):
+            result = database.fetch_one("SELECT title FROM jobs WHERE job_id = ?", (job_id,))
+            self.assertEqual(result['title'], job.title)
+    
+    def test_post_jobs_bulk_invalid_job_inserts_nothing(self):
+        """Test that one invalid job prevents the whole batch from being posted."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        jobs = [
+            Job(farmer_id=farmer['farmer_id'], title="Valid Job",
+                skill_required="Planting", location="Location"),
+            Job(farmer_id=farmer['farmer_id'], title="",
+                skill_required="Planting", location="Location"),
+        ]
+        
+        self.assertIsNone(job_management.post_jobs_bulk(jobs))
+        self.assertEqual(database.fetch_all("SELECT * FROM jobs"), [])
+    
     def test_view_all_jobs(self):
         """Test viewing all jobs."""
         farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
         farmer_id = farmer['farmer_id']
         
         # Insert multiple jobs
-        for i in range(3):
-            database.execute_query(
-                """INSERT INTO jobs (farmer_id, title, skill_required, location, status) 
-                   VALUES (?, ?, ?, ?, ?)""",
-                (farmer_id, f"Job {i}", "Planting", f"Location {i}", "open")
-            )
+        database.execute_many(
+            """INSERT INTO jobs (farmer_id, title, skill_required, location, status) 
+               VALUES (?, ?, ?, ?, ?)""",
+            [(farmer_id, f"Job {i}", "Planting", f"Location {i}", "open") for i in range(3)]
+        )
         
         # Fetch all jobs
         jobs = database.fetch_all("SELECT * FROM jobs ORDER BY job_id")
@@ -102,6 +161,25 @@ class TestJobManagement(unittest.TestCase):
         self.assertEqual(jobs[0]['title'], "Job 0")
         self.assertEqual(jobs[2]['title'], "Job 2")
     
+    def test_view_all_jobs_paginates(self):
+        """Test that listings fetch one page at a time and stop on 'q'."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        job_management.post_jobs_bulk([
+            Job(farmer_id=farmer['farmer_id'], title=f"Paged Job {i}",
+                skill_required="Planting", location="Location")
+            for i in range(5)
+        ])
+        
+        with mock.patch.object(job_management, "_render_jobs") as render, \
+                mock.patch("builtins.input", side_effect=["", "q"]) as prompt:
+            job_management.view_all_jobs(limit=2)
+        
+        self.assertEqual([len(call.args[0]) for call in render.call_args_list], [2, 2])
+        self.assertEqual(prompt.call_count, 2)
+        # Bulk-posted jobs share a timestamp; job_id keeps the pages disjoint
+        ids = [row[0] for call in render.call_args_list for row in call.args[0]]
+        self.assertEqual(ids, sorted(set(ids), reverse=True))
+    
     def test_view_farmer_jobs(self):
         """Test viewing jobs for a specific farmer."""
         farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
@@ -149,6 +227,118 @@ class TestJobManagement(unittest.TestCase):
         self.assertEqual(len(jobs), 1)
         self.assertEqual(jobs[0]['title'], "Kigali Job")
     
+    def test_search_jobs_by_location_modes(self):
+        """Test exact, prefix and substring location search."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        job_management.post_jobs_bulk([
+            Job(farmer_id=farmer['farmer_id'], title=title,
+                skill_required="Planting", location=location)
+            for title, location in (("Kigali Job", "Kigali, Rwanda"),
+                                    ("Musanze Job", "Musanze"),
+                                    ("Percent Job", "100% Kigali"))
+        ])
+        
+        def titles(location, mode):
+            with mock.patch.object(job_management, "_render_jobs") as render:
+                job_management.search_jobs_by_location(location, mode=mode)
+            return sorted(row[1] for call in render.call_args_list for row in call.args[0])
+        
+        self.assertEqual(titles("musanze", "exact"), ["Musanze Job"])
+        self.assertEqual(titles("kigali", "prefix"), ["Kigali Job"])
+        self.assertEqual(titles("Kigali", "substring"), ["Kigali Job", "Percent Job"])
+        self.assertEqual(titles("%", "prefix"), [])
+    
+    def test_menu_location_search_matches_substrings(self):
+        """Test that the menu's location search finds text anywhere in the location."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        job_management.post_jobs_bulk([
+            Job(farmer_id=farmer['farmer_id'], title="Kigali Job",
+                skill_required="Planting", location="Kigali, Rwanda")
+        ])
+        
+        with mock.patch("builtins.input", side_effect=["Rwanda", ""]), \
+                mock.patch.object(main, "clear_screen"):
+            titles, _ = self._listed_titles(main.handle_search_jobs)
+        
+        self.assertEqual(titles, ["Kigali Job"])
+    
+    def _post_search_fixtures(self):
+        """Post jobs with distinct titles, skills and statuses for the search views."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        job_management.post_jobs_bulk([
+            Job(farmer_id=farmer['farmer_id'], title=title, skill_required=skill,
+                location="Kigali", status=status)
+            for title, skill, status in (
+                ("Maize Planting Job", "Planting, Harvesting", "open"),
+                ('Harvest "Rush" Job', "Harvesting", "filled"),
+                ("Irrigation Job", "Irrigation", "closed"),
+            )
+        ])
+    
+    def _listed_titles(self, view, *args):
+        """Run a listing view and return the sorted titles it rendered plus its output."""
+        out = io.StringIO()
+        with mock.patch.object(job_management, "_render_jobs") as render, \
+                contextlib.redirect_stdout(out):
+            view(*args)
+        titles = sorted(row[1] for call in render.call_args_list for row in call.args[0])
+        return titles, out.getvalue()
+    
+    def test_view_jobs_by_skill_matches_tokens(self):
+        """Test that skill search matches every word as a word prefix, in any position."""
+        self._post_search_fixtures()
+        
+        titles, _ = self._listed_titles(job_management.view_jobs_by_skill, "harvest")
+        self.assertEqual(titles, ['Harvest "Rush" Job', "Maize Planting Job"])
+        titles, _ = self._listed_titles(job_management.view_jobs_by_skill, "HARVEST plant")
+        self.assertEqual(titles, ["Maize Planting Job"])
+    
+    def test_view_jobs_by_title_special_characters(self):
+        """Test that FTS5 syntax characters in the search text are treated as plain text."""
+        self._post_search_fixtures()
+        
+        for text, expected in (('"rush"', ['Harvest "Rush" Job']),
+                               ("irrigation:", ["Irrigation Job"]),
+                               ('job" OR *', []),
+                               ("maize*) NOT (", [])):
+            with self.subTest(text=text):
+                titles, output = self._listed_titles(job_management.view_jobs_by_title, text)
+                self.assertEqual(titles, expected)
+                # A rejected MATCH expression would also list nothing, after a "Fetch error"
+                self.assertNotIn("Fetch error", output)
+        titles, output = self._listed_titles(job_management.view_jobs_by_title, '"*')
+        self.assertEqual(titles, [])
+        self.assertIn("No jobs found matching", output)
+    
+    def test_view_jobs_by_status(self):
+        """Test that status listings only show jobs with that status."""
+        self._post_search_fixtures()
+        
+        for status, expected in (("open", ["Maize Planting Job"]),
+                                 ("FILLED", ['Harvest "Rush" Job']),
+                                 ("closed", ["Irrigation Job"])):
+            with self.subTest(status=status):
+                titles, _ = self._listed_titles(job_management.view_jobs_by_status, status)
+                self.assertEqual(titles, expected)
+        titles, output = self._listed_titles(job_management.view_jobs_by_status, "pending")
+        self.assertEqual(titles, [])
+        self.assertIn("Invalid status", output)
+    
+    def test_job_searches_with_no_results(self):
+        """Test that searches without matches print their message and render nothing."""
+        self._post_search_fixtures()
+        database.execute_query("UPDATE jobs SET status = 'open'")
+        
+        for view, arg, message in (
+            (job_management.view_jobs_by_skill, "beekeeping", "No jobs found requiring 'beekeeping'."),
+            (job_management.view_jobs_by_title, "tractor", "No jobs found matching 'tractor'."),
+            (job_management.view_jobs_by_status, "filled", "No filled jobs found."),
+        ):
+            with self.subTest(view=view.__name__):
+                titles, output = self._listed_titles(view, arg)
+                self.assertEqual(titles, [])
+                self.assertIn(message, output)
+    
     def test_update_job_status(self):
         """Test updating job status."""
         farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
@@ -176,6 +366,37 @@ class TestJobManagement(unittest.TestCase):
         result = database.fetch_one("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
         self.assertEqual(result['status'], "filled")
     
+    def test_update_job_status_function(self):
+        """Test update_job_status updates an existing job in place."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        job_ids = job_management.post_jobs_bulk([
+            Job(farmer_id=farmer['farmer_id'], title="Test Job",
+                skill_required="Planting", location="Location")
+        ])
+        
+        job_management.update_job_status(job_ids[0], "closed")
+        
+        result = database.fetch_one("SELECT status FROM jobs WHERE job_id = ?", (job_ids[0],))
+        self.assertEqual(result['status'], "closed")
+    
+    def test_update_job_prompts_before_writing(self):
+        """Test update_job keeps blank answers and writes the new values."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        job_ids = job_management.post_jobs_bulk([
+            Job(farmer_id=farmer['farmer_id'], title="Old Title",
+                skill_required="Planting", location="Location")
+        ])
+        
+        answers = ["New Title", "", "", "", "3 days", ""]
+        with mock.patch("builtins.input", side_effect=answers):
+            job_management.update_job(job_ids[0])
+        
+        result = database.fetch_one(
+            "SELECT title, skill_required, duration FROM jobs WHERE job_id = ?", (job_ids[0],)
+        )
+        self.assertEqual(result, {'title': "New Title", 'skill_required': "Planting",
+                                  'duration': "3 days"})
+    
     def test_delete_job(self):
         """Test deleting a job."""
         farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
@@ -199,8 +420,21 @@ class TestJobManagement(unittest.TestCase):
         # Verify deletion
         result = database.fetch_one("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
         self.assertIsNone(result)
-
-
-if __name__ == '__main__':
-    unittest.main()
-
+    
+    def test_delete_job_function(self):
+        """Test delete_job removes the job and names it by title."""
+        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
+        job_ids = job_management.post_jobs_bulk([
+            Job(farmer_id=farmer['farmer_id'], title="Test Job",
+                skill_required="Planting", location="Location")
+        ])
+        
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            job_management.delete_job(job_ids[0])
+            job_management.delete_job(job_ids[0])
+        
+        self.assertIn("Job 'Test Job' deleted successfully.", out.getvalue())
+        self.assertIn(f"Job with ID {job_ids[0]} not found.", out.getvalue())
+        result = database.fetch_one("SELECT * FROM jobs WHERE job_id = ?", (job_ids[0],))
+        self.assertIsNone(result)
@@ -5,89 +5,111 @@ Tests the job-worker matching algorithm and scoring system.
 """
 
 import unittest
-import sys
 import os
 import tempfile
 import shutil
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import io
+import contextlib
 
 import database
-from matching_engine import MatchingEngine, match_location_text, parse_latlon
+from matching_engine import (Candidates, MatchingEngine, demo, geo_point, haversine_km,
+                             main, match_location_text, parse_latlon, parse_skills,
+                             popcount, rank_candidates, skill_bits, skill_scores)
 
 
 class TestMatchingEngine(unittest.TestCase):
     """Test cases for matching engine operations."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a temporary directory for test database
-        self.test_dir = tempfile.mkdtemp()
-        self.original_db_path = database.DB_PATH
-        database.DB_PATH = os.path.join(self.test_dir, "test_agri_jobs.db")
-        database.DB_DIR = self.test_dir
+    @classmethod
+    def setUpClass(cls):
+        """Build the fixture database once; each test works on its own copy."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.test_dir = cls.temp_dir.name
+        cls.original_db_path = database.DB_PATH
+        # Throwaway databases: skip journaling to disk and fsyncs
+        cls.original_fast_pragmas = database.FAST_UNSAFE_PRAGMAS
+        database.FAST_UNSAFE_PRAGMAS = True
+        cls.template_path = os.path.join(cls.test_dir, "template.db")
+        database.DB_PATH = cls.template_path
+        database.DB_DIR = cls.test_dir
         
         # Initialize test database
         database.init_database()
         
         # Insert test data
-        self.setup_test_data()
-    
-    def setup_test_data(self):
-        """Set up test farmers, workers, and jobs."""
-        # Insert test farmer
-        database.execute_query(
-            "INSERT INTO farmers (name, phone, location) VALUES (?, ?, ?)",
-            ("Test Farmer", "1234567890", "Kigali, Rwanda")
-        )
+        cls.setup_test_data()
         
-        farmer = database.fetch_one("SELECT farmer_id FROM farmers LIMIT 1")
-        self.farmer_id = farmer['farmer_id']
-        
-        # Insert test workers
-        database.execute_query(
-            """INSERT INTO workers (name, phone, location, skills, available) 
-               VALUES (?, ?, ?, ?, ?)""",
-            ("Worker 1", "1111111111", "Kigali, Rwanda", "Planting, Harvesting", 1)
-        )
-        database.execute_query(
-            """INSERT INTO workers (name, phone, location, skills, available) 
-               VALUES (?, ?, ?, ?, ?)""",
-            ("Worker 2", "2222222222", "Other Location", "Planting", 1)
+        # Fixture rows are identical in every copy, so read them once
+        cls.planting_job = database.fetch_one(
+            "SELECT * FROM jobs WHERE title = ?",
+            ("Planting Job",)
         )
-        database.execute_query(
-            """INSERT INTO workers (name, phone, location, skills, available) 
-               VALUES (?, ?, ?, ?, ?)""",
-            ("Worker 3", "3333333333", "Kigali, Rwanda", "Irrigation", 0)  # Not available
+        cls.worker1 = database.fetch_one(
+            "SELECT * FROM workers WHERE name = ?",
+            ("Worker 1",)
         )
         
-        # Insert test jobs
-        database.execute_query(
-            """INSERT INTO jobs (farmer_id, title, skill_required, location, status) 
-               VALUES (?, ?, ?, ?, ?)""",
-            (self.farmer_id, "Planting Job", "Planting", "Kigali, Rwanda", "open")
-        )
-        database.execute_query(
-            """INSERT INTO jobs (farmer_id, title, skill_required, location, status) 
-               VALUES (?, ?, ?, ?, ?)""",
-            (self.farmer_id, "Harvesting Job", "Harvesting", "Kigali, Rwanda", "open")
-        )
+        # Close the template's connections before it is copied
+        database.close_all()
+        database.DB_PATH = cls.original_db_path
+        database.DB_DIR = "data"
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the fixture database and every per-test copy."""
+        database.FAST_UNSAFE_PRAGMAS = cls.original_fast_pragmas
+        cls.temp_dir.cleanup()
+    
+    def setUp(self):
+        """Give the test a fresh copy of the fixture database."""
+        database.DB_PATH = os.path.join(self.test_dir, f"{self._testMethodName}.db")
+        database.DB_DIR = self.test_dir
+        shutil.copyfile(self.template_path, database.DB_PATH)
+    
+    @classmethod
+    def setup_test_data(cls):
+        """Set up test farmers, workers, and jobs."""
+        # One transaction for every fixture row
+        with database.transaction():
+            # Insert test farmer
+            cls.farmer_id = database.execute_query(
+                "INSERT INTO farmers (name, phone, location) VALUES (?, ?, ?)",
+                ("Test Farmer", "1234567890", "Kigali, Rwanda")
+            ).lastrowid
+            
+            # Insert test workers
+            database.execute_many(
+                """INSERT INTO workers (name, phone, location, skills, available) 
+                   VALUES (?, ?, ?, ?, ?)""",
+                [
+                    ("Worker 1", "1111111111", "Kigali, Rwanda", "Planting, Harvesting", 1),
+                    ("Worker 2", "2222222222", "Other Location", "Planting", 1),
+                    ("Worker 3", "3333333333", "Kigali, Rwanda", "Irrigation", 0),  # Not available
+                ]
+            )
+            
+            # Insert test jobs
+            database.execute_many(
+                """INSERT INTO jobs (farmer_id, title, skill_required, location, status) 
+                   VALUES (?, ?, ?, ?, ?)""",
+                [
+                    (cls.farmer_id, "Planting Job", "Planting", "Kigali, Rwanda", "open"),
+                    (cls.farmer_id, "Harvesting Job", "Harvesting", "Kigali, Rwanda", "open"),
+                ]
+            )
     
     def tearDown(self):
         """Clean up after tests."""
+        # Close pooled connections to the test database copy
+        database.close_all()
         # Restore original database path
         database.DB_PATH = self.original_db_path
         database.DB_DIR = "data"
-        # Remove temporary directory
-        shutil.rmtree(self.test_dir, ignore_errors=True)
     
     def test_match_job_to_workers(self):
         """Test matching workers to a job."""
         engine = MatchingEngine()
-        job = database.fetch_one(
-            "SELECT * FROM jobs WHERE title = ?",
-            ("Planting Job",)
-        )
+        job = self.planting_job
         
         matches = engine.match_job_to_workers(job, top_n=10)
         
@@ -99,10 +121,7 @@ class TestMatchingEngine(unittest.TestCase):
     def test_match_worker_to_jobs(self):
         """Test matching jobs to a worker."""
         engine = MatchingEngine()
-        worker = database.fetch_one(
-            "SELECT * FROM workers WHERE name = ?",
-            ("Worker 1",)
-        )
+        worker = self.worker1
         
         matches = engine.match_worker_to_jobs(worker, top_n=10)
         
@@ -114,10 +133,7 @@ class TestMatchingEngine(unittest.TestCase):
     def test_match_score_calculation(self):
         """Test that match scores are calculated correctly."""
         engine = MatchingEngine()
-        job = database.fetch_one(
-            "SELECT * FROM jobs WHERE title = ?",
-            ("Planting Job",)
-        )
+        job = self.planting_job
         
         matches = engine.match_job_to_workers(job, top_n=10)
         
@@ -141,6 +157,12 @@ class TestMatchingEngine(unittest.TestCase):
         score = match_location_text("Kigali", "New York")
         self.assertLess(score, 0.5)
     
+    def test_match_location_text_symmetric(self):
+        """Test that argument order and case don't change the (cached) text score."""
+        self.assertEqual(match_location_text("Musanze District", " kigali district"),
+                         match_location_text("Kigali District", "musanze district "))
+        self.assertEqual(match_location_text("KIGALI", "kigali"), 1.0)
+    
     def test_parse_latlon_valid(self):
         """Test parsing valid lat/lon coordinates."""
         result = parse_latlon("-1.95,30.06")
@@ -156,13 +178,93 @@ class TestMatchingEngine(unittest.TestCase):
         result = parse_latlon("invalid")
         self.assertIsNone(result)
     
+    def test_distance_to_matches_haversine(self):
+        """Test that the hoisted distance lookup agrees with haversine_km."""
+        origin = "-1.95,30.06"
+        points = ["-2.60,29.74", "-1.95,30.06", "Kigali", "0.31,32.58"]
+        candidates = Candidates.from_rows([{"skills": "", "location": p} for p in points], "skills")
+        
+        distance = candidates.distance_to(geo_point(origin))
+        
+        self.assertIsNone(distance(2))
+        for i, point in enumerate(points):
+            if i != 2:
+                self.assertAlmostEqual(
+                    distance(i), haversine_km(parse_latlon(origin), parse_latlon(point)), places=9
+                )
+    
+    def test_skill_bits_overlap(self):
+        """Test that skill bitsets count shared skills like a set intersection."""
+        job = skill_bits(parse_skills("Planting, Harvesting, Weeding"))
+        worker = skill_bits(parse_skills(" harvesting,PLANTING,Irrigation"))
+        
+        self.assertEqual(popcount(job), 3)
+        self.assertEqual(popcount(job & worker), 2)
+        self.assertEqual(skill_bits(parse_skills("")), 0)
+    
+    def test_rank_candidates_weights(self):
+        """Test the 60/30/10 weighting and neutral skill score of ranked candidates."""
+        planting = skill_bits(parse_skills("Planting"))
+        weeding = skill_bits(parse_skills("Weeding"))
+        skill = skill_scores([planting, planting, 0], [planting, weeding, weeding])
+        
+        ranked = rank_candidates(skill, [1.0, 0.0, 1.0], [1.0, 0.5, 0.0].__getitem__, 3)
+        
+        self.assertEqual([i for i, _ in ranked], [0, 2, 1])
+        for (_, score), expected in zip(ranked, [1.0, 0.4, 0.15]):
+            self.assertAlmostEqual(score, expected)
+    
+    def test_rank_candidates_skips_hopeless_proximity(self):
+        """Test that candidates whose best possible score can't make the top N are never scored."""
+        looked_up = []
+        
+        def proximity_of(i):
+            looked_up.append(i)
+            return 1.0
+        
+        ranked = rank_candidates([1.0, 0.0, 1.0, 0.0], [1.0] * 4, proximity_of, 2)
+        
+        self.assertEqual([i for i, _ in ranked], [0, 2])
+        self.assertEqual(sorted(looked_up), [0, 2])
+    
+    def test_candidates_share_distance_per_point(self):
+        """Test that candidates at the same coordinates share one distance computation."""
+        rows = [{"skills": "Planting", "location": loc}
+                for loc in ("-1.95,30.06", "Kigali", "-1.95,30.06", "-2.60,29.74")]
+        candidates = Candidates.from_rows(rows, "skills")
+        
+        self.assertEqual(len(candidates.unique_points), 2)
+        distance = candidates.distance_to(geo_point("-1.95,30.06"))
+        self.assertEqual(distance(0), distance(2))
+        self.assertIsNone(distance(1))
+        self.assertGreater(distance(3), 0)
+    
+    def test_candidates_skill_index(self):
+        """Test that the inverted skill index finds every candidate sharing a required skill."""
+        rows = [{"skills": skills, "location": ""}
+                for skills in ("Planting, Weeding", "Irrigation", "weeding", "")]
+        candidates = Candidates.from_rows(rows, "skills")
+        
+        required = skill_bits(parse_skills("Weeding, Pruning"))
+        
+        self.assertEqual(candidates.sharing_skills(required), {0, 2})
+        self.assertEqual(candidates.sharing_skills(0), set())
+    
+    def test_match_job_nobody_is_skilled_for(self):
+        """Test that workers without any required skill are still ranked when no one has it."""
+        engine = MatchingEngine()
+        job = {"job_id": 1, "skill_required": "Beekeeping", "location": "-1.95,30.06"}
+        
+        matches = engine.match_job_to_workers(job, top_n=10)
+        
+        available = database.fetch_all("SELECT worker_id FROM workers WHERE available = 1")
+        self.assertEqual(len(matches), min(10, len(available)))
+        self.assertTrue(all(m["reasons"][0] == "skills matched 0/1" for m in matches))
+    
     def test_available_workers_only(self):
         """Test that only available workers are matched."""
         engine = MatchingEngine()
-        job = database.fetch_one(
-            "SELECT * FROM jobs WHERE title = ?",
-            ("Planting Job",)
-        )
+        job = self.planting_job
         
         matches = engine.match_job_to_workers(job, top_n=10)
         
@@ -174,10 +276,7 @@ class TestMatchingEngine(unittest.TestCase):
     def test_match_saves_to_database(self):
         """Test that matches are saved to the matches table."""
         engine = MatchingEngine()
-        job = database.fetch_one(
-            "SELECT * FROM jobs WHERE title = ?",
-            ("Planting Job",)
-        )
+        job = self.planting_job
         
         matches = engine.match_job_to_workers(job, top_n=10)
         
@@ -188,8 +287,93 @@ class TestMatchingEngine(unittest.TestCase):
         )
         
         self.assertGreater(len(saved_matches), 0)
+    
+    def test_match_all_open_jobs(self):
+        """Test that batch matching gives each open job the same matches as one-by-one matching."""
+        engine = MatchingEngine()
+        
+        results = engine.match_all_open_jobs(top_n=5)
+        
+        open_jobs = database.fetch_all("SELECT * FROM jobs WHERE status = 'open'")
+        self.assertEqual(sorted(results), sorted(j["job_id"] for j in open_jobs))
+        saved = database.fetch_all("SELECT * FROM matches")
+        self.assertEqual(len(saved), sum(len(m) for m in results.values()))
+        for job in open_jobs:
+            single = engine.match_job_to_workers(job, top_n=5)
+            self.assertEqual([(m["worker_id"], m["score"]) for m in results[job["job_id"]]],
+                             [(m["worker_id"], m["score"]) for m in single])
+    
+    def test_match_without_matches_table(self):
+        """Test that matching still works when there is no matches table to save to."""
+        database.execute_query("DROP TABLE matches")
+        engine = MatchingEngine()
+        job = self.planting_job
+        
+        matches = engine.match_job_to_workers(job, top_n=10)
+        
+        self.assertFalse(engine._has_matches)
+        self.assertGreater(len(matches), 0)
 
-
-if __name__ == '__main__':
-    unittest.main()
-
+    
+    def test_match_worker_to_jobs_saves_every_match(self):
+        """Test that each returned job match is saved in one batch."""
+        engine = MatchingEngine()
+        worker = self.worker1
+        
+        matches = engine.match_worker_to_jobs(worker, top_n=10)
+        
+        saved = database.fetch_all(
+            "SELECT job_id, match_score FROM matches WHERE worker_id = ? ORDER BY match_id",
+            (worker['worker_id'],)
+        )
+        self.assertEqual([row['job_id'] for row in saved], [m['job_id'] for m in matches])
+    
+    def test_match_worker_to_jobs_uses_job_location(self):
+        """Test that job proximity is measured from each job's own coordinates."""
+        database.execute_query(
+            "INSERT INTO jobs (farmer_id, title, skill_required, location) VALUES (?, ?, ?, ?)",
+            (self.farmer_id, "Far Job", "Planting", "-2.95,29.74")
+        )
+        engine = MatchingEngine()
+        worker = {"worker_id": 99, "skills": "Planting", "location": "-1.95,30.06"}
+        
+        matches = engine.match_worker_to_jobs(worker, top_n=10)
+        
+        far = next(m for m in matches if m['title'] == "Far Job")
+        self.assertIn("proximity_score 0.00", far['reasons'])
+    
+    def test_worker_candidates_cached_until_workers_change(self):
+        """Test that available workers are refetched only after the workers table changes."""
+        engine = MatchingEngine()
+        first = engine._get_all_workers()
+        self.assertIs(engine._get_all_workers(), first)
+        
+        database.execute_query(
+            "INSERT INTO workers (name, phone, location, skills, available) VALUES (?, ?, ?, ?, ?)",
+            ("Worker 4", "4444444444", "Kigali, Rwanda", "Weeding", 1)
+        )
+        
+        refreshed = engine._get_all_workers()
+        self.assertEqual(len(refreshed), len(first) + 1)
+    
+    def test_demo_seeds_only_empty_tables(self):
+        """Test that demo() seeds the empty tables and leaves existing data alone."""
+        database.execute_query("DELETE FROM workers")
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            demo(MatchingEngine())
+        
+        counts = [database.fetch_one(f"SELECT COUNT(*) AS n FROM {table}")['n']
+                  for table in ("farmers", "workers", "jobs")]
+        self.assertEqual(counts, [1, 3, 2])
+    
+    def test_demo_cli_saves_matches_on_fresh_database(self):
+        """Test that --demo saves its matches when the database does not exist yet."""
+        database.DB_DIR = os.path.join(self.test_dir, self._testMethodName)
+        database.DB_PATH = os.path.join(database.DB_DIR, "fresh.db")
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(["--demo"])
+        
+        saved = database.fetch_one("SELECT COUNT(*) AS n FROM matches")['n']
+        self.assertEqual(saved, 5)  # 3 workers for the first job, 2 jobs for the first worker
@@ -5,10 +5,6 @@ Tests data validation functions and model classes.
 """
 
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import (
     validate_phone,
@@ -23,88 +19,90 @@ from models import (
 class TestValidationFunctions(unittest.TestCase):
     """Test cases for validation functions."""
     
+    VALID_PHONES = (
+        "1234567890",
+        "123-456-7890",
+        "123 456 7890",
+        "(123) 456-7890",
+        "+1234567890",
+        "+1-234-567-8900",
+    )
+    
+    INVALID_PHONES = (
+        "",
+        "123",  # Too short
+        "1234567890123456",  # Too long
+        "abc1234567",  # Contains letters
+        "123-456",  # Too short
+        "\u00b9\u00b2\u00b34567890",  # Superscript digits
+        None,
+    )
+    
+    VALID_EMAILS = (
+        "test@example.com",
+        "user.name@domain.co.uk",
+        "user+tag@example.org",
+        "test123@test-domain.com",
+    )
+    
+    INVALID_EMAILS = (
+        "",
+        "notanemail",
+        "@example.com",
+        "user@",
+        "user@domain",
+        "user space@example.com",
+        "a" * 250 + "@example.com",  # Longer than 254 characters
+        None,
+    )
+    
+    VALID_LOCATIONS = (
+        "Kigali, Rwanda",
+        "New York",
+        "123 Main Street",
+        "A" * 100,  # Reasonable length
+    )
+    
+    INVALID_LOCATIONS = (
+        "",
+        " ",
+        "A" * 201,  # Too long
+        None,
+    )
+    
     def test_validate_phone_valid_formats(self):
         """Test phone validation with various valid formats."""
-        valid_phones = [
-            "1234567890",
-            "123-456-7890",
-            "123 456 7890",
-            "(123) 456-7890",
-            "+1234567890",
-            "+1-234-567-8900"
-        ]
-        
-        for phone in valid_phones:
+        for phone in self.VALID_PHONES:
             with self.subTest(phone=phone):
                 self.assertTrue(validate_phone(phone), f"Should accept: {phone}")
     
     def test_validate_phone_invalid_formats(self):
         """Test phone validation with invalid formats."""
-        invalid_phones = [
-            "",
-            "123",  # Too short
-            "1234567890123456",  # Too long
-            "abc1234567",  # Contains letters
-            "123-456",  # Too short
-            None
-        ]
-        
-        for phone in invalid_phones:
+        for phone in self.INVALID_PHONES:
             with self.subTest(phone=phone):
                 self.assertFalse(validate_phone(phone), f"Should reject: {phone}")
     
     def test_validate_email_valid(self):
         """Test email validation with valid emails."""
-        valid_emails = [
-            "test@example.com",
-            "user.name@domain.co.uk",
-            "user+tag@example.org",
-            "test123@test-domain.com"
-        ]
-        
-        for email in valid_emails:
+        for email in self.VALID_EMAILS:
             with self.subTest(email=email):
                 self.assertTrue(validate_email(email), f"Should accept: {email}")
     
     def test_validate_email_invalid(self):
         """Test email validation with invalid emails."""
-        invalid_emails = [
-            "",
-            "notanemail",
-            "@example.com",
-            "user@",
-            "user@domain",
-            "user space@example.com",
-            None
-        ]
-        
-        for email in invalid_emails:
+        for email in self.INVALID_EMAILS:
             with self.subTest(email=email):
                 self.assertFalse(validate_email(email), f"Should reject: {email}")
     
     def test_validate_location_valid(self):
         """Test location validation with valid locations."""
-        valid_locations = [
-            "Kigali, Rwanda",
-            "New York",
-            "123 Main Street",
-            "A" * 100  # Reasonable length
-        ]
-        
-        for location in valid_locations:
+        for location in self.VALID_LOCATIONS:
             with self.subTest(location=location):
                 self.assertTrue(validate_location(location), f"Should accept: {location}")
     
     def test_validate_location_invalid(self):
         """Test location validation with invalid locations."""
-        invalid_locations = [
-            "",
-            " ",
-            "A" * 201,  # Too long
-            None
-        ]
-        
-        for location in invalid_locations:
+        for location in self.INVALID_LOCATIONS:
             with self.subTest(location=location):
                 self.assertFalse(validate_location(location), f"Should reject: {location}")
 
@@ -264,6 +262,22 @@ class TestWorkerModel(unittest.TestCase):
         self.assertTrue(worker.has_skill("Planting"))
         self.assertTrue(worker.has_skill("planting"))  # Case insensitive
         self.assertFalse(worker.has_skill("Irrigation"))
+    
+    def test_worker_skills_cache_follows_updates(self):
+        """Test that cached skill lookups are refreshed when skills is reassigned."""
+        worker = Worker(
+            name="Jane Smith",
+            phone="0987654321",
+            location="Kigali, Rwanda",
+            skills="Planting"
+        )
+        self.assertFalse(worker.has_skill("Irrigation"))
+        
+        worker.skills = "Planting, Irrigation"
+        
+        self.assertTrue(worker.has_skill("irrigation"))
+        self.assertEqual(worker.get_skills_list(), ["Planting", "Irrigation"])
+        self.assertEqual(worker.skill_set, frozenset({"planting", "irrigation"}))
 
 
 class TestJobModel(unittest.TestCase):
@@ -340,8 +354,17 @@ class TestJobModel(unittest.TestCase):
         self.assertIsInstance(job_dict, dict)
         self.assertEqual(job_dict['job_id'], 5)
         self.assertEqual(job_dict['title'], "Farm Worker")
-
-
-if __name__ == '__main__':
-    unittest.main()
-
+    
+    def test_job_equality_by_id(self):
+        """Test that saved jobs deduplicate by ID and unsaved jobs only equal themselves."""
+        first = Job(farmer_id=1, title="Farm Worker", skill_required="Planting",
+                    location="Kigali, Rwanda", job_id=5)
+        again = Job(farmer_id=1, title="Renamed", skill_required="Weeding",
+                    location="Musanze", job_id=5)
+        unsaved = Job(farmer_id=1, title="Farm Worker", skill_required="Planting",
+                      location="Kigali, Rwanda")
+        
+        self.assertEqual(first, again)
+        self.assertEqual(len({first, again, unsaved}), 2)
+        self.assertNotEqual(unsaved, Job(farmer_id=1, title="Farm Worker",
+                                         skill_required="Planting", location="Kigali, Rwanda"))
@@ -5,38 +5,61 @@ Tests user registration and profile management functions.
 """
 
 import unittest
-import sys
 import os
 import tempfile
 import shutil
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import io
+import contextlib
+import csv
 
 import database
+import user_management
 from models import Farmer, Worker
 
 
 class TestUserManagement(unittest.TestCase):
     """Test cases for user management operations."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a temporary directory for test database
-        self.test_dir = tempfile.mkdtemp()
-        self.original_db_path = database.DB_PATH
-        database.DB_PATH = os.path.join(self.test_dir, "test_agri_jobs.db")
-        database.DB_DIR = self.test_dir
+    @classmethod
+    def setUpClass(cls):
+        """Build the empty schema once; each test works on its own copy."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.test_dir = cls.temp_dir.name
+        cls.original_db_path = database.DB_PATH
+        # Throwaway databases: skip journaling to disk and fsyncs
+        cls.original_fast_pragmas = database.FAST_UNSAFE_PRAGMAS
+        database.FAST_UNSAFE_PRAGMAS = True
+        cls.template_path = os.path.join(cls.test_dir, "template.db")
+        database.DB_PATH = cls.template_path
+        database.DB_DIR = cls.test_dir
         
         # Initialize test database
         database.init_database()
+        
+        # Close the template's connections before it is copied
+        database.close_all()
+        database.DB_PATH = cls.original_db_path
+        database.DB_DIR = "data"
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the template database and every per-test copy."""
+        database.FAST_UNSAFE_PRAGMAS = cls.original_fast_pragmas
+        cls.temp_dir.cleanup()
+    
+    def setUp(self):
+        """Give the test a fresh copy of the initialized database."""
+        database.DB_PATH = os.path.join(self.test_dir, f"{self._testMethodName}.db")
+        database.DB_DIR = self.test_dir
+        shutil.copyfile(self.template_path, database.DB_PATH)
     
     def tearDown(self):
         """Clean up after tests."""
+        # Close pooled connections to the test database copy
+        database.close_all()
         # Restore original database path
         database.DB_PATH = self.original_db_path
         database.DB_DIR = "data"
-        # Remove temporary directory
-        shutil.rmtree(self.test_dir, ignore_errors=True)
     
     def test_farmer_registration_database_insert(self):
         """Test that farmer registration inserts data into database."""
@@ -48,15 +71,10 @@ class TestUserManagement(unittest.TestCase):
         )
         
         # Insert into database
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        farmer_id = database.execute_query(
             "INSERT INTO farmers (name, phone, location, email) VALUES (?, ?, ?, ?)",
             (farmer.name, farmer.phone, farmer.location, farmer.email)
-        )
-        conn.commit()
-        farmer_id = cursor.lastrowid
-        conn.close()
+        ).lastrowid
         
         # Verify insertion
         result = database.fetch_one("SELECT * FROM farmers WHERE farmer_id = ?", (farmer_id,))
@@ -76,15 +94,10 @@ class TestUserManagement(unittest.TestCase):
         )
         
         # Insert into database
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        worker_id = database.execute_query(
             "INSERT INTO workers (name, phone, location, skills, available) VALUES (?, ?, ?, ?, ?)",
             (worker.name, worker.phone, worker.location, worker.skills, int(worker.available))
-        )
-        conn.commit()
-        worker_id = cursor.lastrowid
-        conn.close()
+        ).lastrowid
         
         # Verify insertion
         result = database.fetch_one("SELECT * FROM workers WHERE worker_id = ?", (worker_id,))
@@ -97,15 +110,10 @@ class TestUserManagement(unittest.TestCase):
     def test_update_worker_skills(self):
         """Test updating worker skills."""
         # Insert test worker
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        worker_id = database.execute_query(
             "INSERT INTO workers (name, phone, location, skills) VALUES (?, ?, ?, ?)",
             ("Test Worker", "1234567890", "Test Location", "Old Skills")
-        )
-        conn.commit()
-        worker_id = cursor.lastrowid
-        conn.close()
+        ).lastrowid
         
         # Update skills
         database.execute_query(
@@ -120,15 +128,10 @@ class TestUserManagement(unittest.TestCase):
     def test_update_worker_availability(self):
         """Test updating worker availability."""
         # Insert test worker
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        worker_id = database.execute_query(
             "INSERT INTO workers (name, phone, location, skills, available) VALUES (?, ?, ?, ?, ?)",
             ("Test Worker", "1234567890", "Test Location", "Skills", 1)
-        )
-        conn.commit()
-        worker_id = cursor.lastrowid
-        conn.close()
+        ).lastrowid
         
         # Update availability
         database.execute_query(
@@ -140,18 +143,22 @@ class TestUserManagement(unittest.TestCase):
         result = database.fetch_one("SELECT * FROM workers WHERE worker_id = ?", (worker_id,))
         self.assertEqual(result['available'], 0)
     
+    def test_update_availability_unknown_worker(self):
+        """Test that updating a missing worker reports it instead of succeeding."""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            user_management.update_availability(999, False)
+        
+        self.assertIn("Worker profile not found.", out.getvalue())
+        self.assertNotIn("SUCCESS", out.getvalue())
+    
     def test_view_farmer_profile(self):
         """Test viewing farmer profile."""
         # Insert test farmer
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        farmer_id = database.execute_query(
             "INSERT INTO farmers (name, phone, location, email) VALUES (?, ?, ?, ?)",
             ("Test Farmer", "1234567890", "Test Location", "test@example.com")
-        )
-        conn.commit()
-        farmer_id = cursor.lastrowid
-        conn.close()
+        ).lastrowid
         
         # Fetch profile
         farmer = database.fetch_one("SELECT * FROM farmers WHERE farmer_id = ?", (farmer_id,))
@@ -163,15 +170,10 @@ class TestUserManagement(unittest.TestCase):
     def test_view_worker_profile(self):
         """Test viewing worker profile."""
         # Insert test worker
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        worker_id = database.execute_query(
             "INSERT INTO workers (name, phone, location, skills) VALUES (?, ?, ?, ?)",
             ("Test Worker", "1234567890", "Test Location", "Planting, Harvesting")
-        )
-        conn.commit()
-        worker_id = cursor.lastrowid
-        conn.close()
+        ).lastrowid
         
         # Fetch profile
         worker = database.fetch_one("SELECT * FROM workers WHERE worker_id = ?", (worker_id,))
@@ -180,7 +182,87 @@ class TestUserManagement(unittest.TestCase):
         self.assertEqual(worker['name'], "Test Worker")
         self.assertEqual(worker['skills'], "Planting, Harvesting")
 
+    
+    def test_view_worker_profile_output(self):
+        """Test that the profile view prints each column with its label, in order."""
+        worker_id = database.execute_query(
+            "INSERT INTO workers (name, phone, location, skills) VALUES (?, ?, ?, ?)",
+            ("Test Worker", "1234567890", "Test Location", "Planting")
+        ).lastrowid
+        
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            user_management.view_worker_profile(worker_id)
+        
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[1], "=== Worker Profile ===")
+        self.assertEqual(lines[2:7], [f"Worker Id: {worker_id}", "Name: Test Worker",
+                                      "Phone: 1234567890", "Location: Test Location",
+                                      "Skills: Planting"])
+        self.assertEqual(lines[7], "Available: 1")
+        self.assertTrue(lines[8].startswith("Registration Date: "))
+    
+    def test_register_farmers_bulk_skips_invalid_rows(self):
+        """Test that bulk registration inserts the valid rows and skips the rest."""
+        rows = [
+            {"name": "Farmer A", "phone": "1234567890", "location": "Kigali", "email": "a@example.com"},
+            {"name": "Farmer B", "phone": "123", "location": "Kigali"},  # Phone too short
+            {"name": "Farmer C", "phone": "0987654321", "location": "Musanze", "email": ""},
+        ]
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            count = user_management.register_farmers_bulk(rows)
+        
+        self.assertEqual(count, 2)
+        farmers = database.fetch_all("SELECT name, email FROM farmers ORDER BY farmer_id")
+        self.assertEqual([(f['name'], f['email']) for f in farmers],
+                         [("Farmer A", "a@example.com"), ("Farmer C", None)])
+    
+    def test_import_workers_csv(self):
+        """Test importing workers from a CSV file with a header row."""
+        path = os.path.join(self.test_dir, f"{self._testMethodName}.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            f.write("name,phone,location,skills,available\n"
+                    "Worker A,1234567890,Kigali,\"Planting, Harvesting\",no\n"
+                    "Worker B,0987654321,Musanze,Irrigation,\n")
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            count = user_management.import_users_csv(path, "worker")
+        
+        self.assertEqual(count, 2)
+        workers = database.fetch_all("SELECT name, skills, available FROM workers ORDER BY worker_id")
+        self.assertEqual([(w['name'], w['skills'], w['available']) for w in workers],
+                         [("Worker A", "Planting, Harvesting", 0), ("Worker B", "Irrigation", 1)])
 
-if __name__ == '__main__':
-    unittest.main()
-
+    
+    def test_import_csv_reports_file_line_of_bad_row(self):
+        """Test that skipped CSV rows are reported by file line, counting the header and multi-line fields."""
+        path = os.path.join(self.test_dir, f"{self._testMethodName}.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            f.write("name,phone,location,email\n"
+                    "Farmer A,1234567890,\"Plot 4\nKigali\",\n"
+                    "Farmer B,123,Kigali,\n")
+        
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            count = user_management.import_users_csv(path, "farmer")
+        
+        self.assertEqual(count, 1)
+        self.assertIn("Line 4 skipped", out.getvalue())
+    
+    def test_import_csv_reports_unreadable_files(self):
+        """Test that undecodable or malformed CSV files are reported instead of raising."""
+        not_utf8 = os.path.join(self.test_dir, f"{self._testMethodName}_latin1.csv")
+        with open(not_utf8, "wb") as f:
+            f.write("name,phone,location\nJos\u00e9,1234567890,Kigali\n".encode("latin-1"))
+        malformed = os.path.join(self.test_dir, f"{self._testMethodName}_malformed.csv")
+        with open(malformed, "w", newline="", encoding="utf-8") as f:
+            f.write("name,phone,location\n\"" + "x" * (csv.field_size_limit() + 1) + "\"\n")
+        
+        for path in (not_utf8, malformed, os.path.join(self.test_dir, "missing.csv")):
+            with self.subTest(path=os.path.basename(path)):
+                out = io.StringIO()
+                with contextlib.redirect_stdout(out):
+                    count = user_management.import_users_csv(path, "farmer")
+                self.assertEqual(count, 0)
+                self.assertIn("Could not read", out.getvalue())
@@ -0,0 +1,89 @@
+"""
+Unit tests for utils module.
+
+Tests screen clearing and table formatting helpers.
+"""
+
+import unittest
+import io
+from unittest import mock
+
+import utils
+
+
+class _TTY(io.StringIO):
+    """Captured stdout that reports itself as a terminal."""
+
+    def isatty(self):
+        return True
+
+
+class TestClearScreen(unittest.TestCase):
+    """Test cases for clear_screen."""
+
+    def setUp(self):
+        """Forget whether ANSI support was detected by an earlier test."""
+        patcher = mock.patch.object(utils, "_ansi_supported", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_writes_ansi_clear_to_terminal(self):
+        """Test that terminals get the escape sequence and no subprocess is started."""
+        out = _TTY()
+        with mock.patch("sys.stdout", out), \
+                mock.patch.object(utils, "_enable_ansi", return_value=True) as enable, \
+                mock.patch("os.system") as system:
+            utils.clear_screen()
+            utils.clear_screen()
+
+        self.assertEqual(out.getvalue(), utils._ANSI_CLEAR * 2)
+        enable.assert_called_once_with()
+        system.assert_not_called()
+
+    def test_skips_captured_output(self):
+        """Test that nothing is written when stdout is not a terminal."""
+        out = io.StringIO()
+        with mock.patch("sys.stdout", out), mock.patch("os.system") as system:
+            utils.clear_screen()
+
+        self.assertEqual(out.getvalue(), "")
+        system.assert_not_called()
+
+    def test_falls_back_to_cls_without_ansi_support(self):
+        """Test that consoles without escape sequence support still get cleared."""
+        out = _TTY()
+        with mock.patch("sys.stdout", out), \
+                mock.patch.object(utils, "_enable_ansi", return_value=False), \
+                mock.patch("os.system") as system:
+            utils.clear_screen()
+
+        self.assertEqual(out.getvalue(), "")
+        system.assert_called_once_with('cls')
+
+
+class TestFormatTable(unittest.TestCase):
+    """Test cases for format_table."""
+
+    HEADERS = ("ID", "Title", "Location")
+
+    def test_columns_sized_to_widest_cell(self):
+        """Test that each column is padded to its widest cell plus four spaces."""
+        table = utils.format_table([(1, "Planting", "Kigali"), (22, "Harvest", None)], self.HEADERS)
+
+        self.assertEqual(table.splitlines(), [
+            "ID    Title       Location    ",
+            "------------------------------",
+            "1     Planting    Kigali      ",
+            "22    Harvest     None        ",
+        ])
+
+    def test_empty_data(self):
+        """Test the placeholder shown for an empty table."""
+        self.assertEqual(utils.format_table([], self.HEADERS), "No data to display.")
+
+    def test_rejects_ragged_rows(self):
+        """Test that rows with too few or too many cells raise instead of losing columns."""
+        for row in ((1, "Planting"), (1, "Planting", "Kigali", "extra")):
+            with self.subTest(cells=len(row)):
+                with self.assertRaises(ValueError):
+                    utils.format_table([(2, "Weeding", "Musanze"), row], self.HEADERS)
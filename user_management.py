@@ -1,3 +1,6 @@
+import csv
+import sys
+
 import database
 from models import Farmer, Worker
 from utils import (
@@ -6,6 +9,29 @@ from utils import (
     print_info,
 )
 
+# SQL used by this module, one constant per statement so every call sends the
+# same text to the pooled connections' statement cache (see job_management)
+_SQL_INSERT_FARMER = "INSERT INTO farmers (name, phone, location, email) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_WORKER = (
+    "INSERT INTO workers (name, phone, location, skills, available) VALUES (?, ?, ?, ?, ?)"
+)
+# Profile columns, in display order
+_FARMER_PROFILE_FIELDS = ("farmer_id", "name", "phone", "location", "email", "registration_date")
+_WORKER_PROFILE_FIELDS = (
+    "worker_id", "name", "phone", "location", "skills", "available", "registration_date"
+)
+_FARMER_PROFILE_LABELS = tuple(f.replace("_", " ").title() for f in _FARMER_PROFILE_FIELDS)
+_WORKER_PROFILE_LABELS = tuple(f.replace("_", " ").title() for f in _WORKER_PROFILE_FIELDS)
+_SQL_SELECT_FARMER = (
+    f"SELECT {', '.join(_FARMER_PROFILE_FIELDS)} FROM farmers WHERE farmer_id = ?"
+)
+_SQL_SELECT_WORKER = (
+    f"SELECT {', '.join(_WORKER_PROFILE_FIELDS)} FROM workers WHERE worker_id = ?"
+)
+_SQL_SELECT_WORKER_SKILLS = "SELECT skills FROM workers WHERE worker_id = ?"
+_SQL_UPDATE_WORKER_SKILLS = "UPDATE workers SET skills = ? WHERE worker_id = ?"
+_SQL_UPDATE_WORKER_AVAILABILITY = "UPDATE workers SET available = ? WHERE worker_id = ?"
+
 
 # ------------------------------
 # Registration Functions (DB-backed)
@@ -30,18 +56,12 @@ def register_farmer():
         return None
 
     try:
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO farmers (name, phone, location, email)
-            VALUES (?, ?, ?, ?)
-            """,
+        # execute_query() checks a pooled connection out and back in, and
+        # closes it instead if the insert fails
+        farmer_id = database.execute_query(
+            _SQL_INSERT_FARMER,
             (farmer.name, farmer.phone, farmer.location, farmer.email),
-        )
-        conn.commit()
-        farmer_id = cursor.lastrowid
-        conn.close()
+        ).lastrowid
 
         print_success(f"Farmer registered successfully! Your ID is: {farmer_id}")
         return farmer_id
@@ -76,18 +96,10 @@ def register_worker():
         return None
 
     try:
-        conn = database.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO workers (name, phone, location, skills, available)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+        worker_id = database.execute_query(
+            _SQL_INSERT_WORKER,
             (worker.name, worker.phone, worker.location, worker.skills, int(worker.available)),
-        )
-        conn.commit()
-        worker_id = cursor.lastrowid
-        conn.close()
+        ).lastrowid
 
         print_success(f"Worker registered successfully! Your ID is: {worker_id}")
         return worker_id
@@ -96,38 +108,188 @@ def register_worker():
         return None
 
 
+# ------------------------------
+# Bulk Registration (DB-backed)
+# ------------------------------
+def _field(row, key):
+    """Return row[key] stripped, or "" when the column is missing or empty."""
+    return (row.get(key) or "").strip()
+
+
+def _numbered(rows):
+    """
+    Pair each input row with the position reported in error messages.
+
+    CSV readers are numbered by the file line each row ends on, which counts
+    the header and quoted multi-line fields; other iterables by row index.
+    """
+    if hasattr(rows, "line_num"):
+        for row in rows:
+            yield f"Line {rows.line_num}", row
+    else:
+        for index, row in enumerate(rows, start=1):
+            yield f"Row {index}", row
+
+
+def _insert_valid(records, sql, to_params, label):
+    """
+    Validate records and insert the valid ones in a single transaction.
+
+    Args:
+        records (list): (position, Farmer or Worker) pairs, in input order
+        sql (str): INSERT statement taking the parameters from to_params
+        to_params (callable): Maps a valid record to its parameter tuple
+        label (str): Plural noun for the messages, e.g. "farmers"
+
+    Returns:
+        int: Number of records inserted (0 if the insert failed)
+    """
+    params = []
+    for position, record in records:
+        is_valid, error = record.validate()
+        if is_valid:
+            params.append(to_params(record))
+        else:
+            print_error(f"{position} skipped: {error}")
+
+    if not params:
+        print_info(f"No valid {label} to register.")
+        return 0
+
+    try:
+        # One executemany in one transaction: one commit for the whole batch
+        database.execute_many(sql, params)
+    except Exception as e:
+        print_error(f"Failed to register {label}: {e}")
+        return 0
+
+    print_success(f"Registered {len(params)} {label}.")
+    return len(params)
+
+
+def register_farmers_bulk(rows):
+    """
+    Register many farmers at once, e.g. when importing an existing roster.
+
+    Rows that fail validation are reported and skipped; the rest are inserted
+    together in one transaction.
+
+    Args:
+        rows (iterable): Dicts with "name", "phone", "location" and optional
+            "email" keys
+
+    Returns:
+        int: Number of farmers registered
+    """
+    farmers = [
+        (position, Farmer(
+            name=_field(row, "name"),
+            phone=_field(row, "phone"),
+            location=_field(row, "location"),
+            email=_field(row, "email") or None,
+        ))
+        for position, row in _numbered(rows)
+    ]
+    return _insert_valid(
+        farmers,
+        _SQL_INSERT_FARMER,
+        lambda f: (f.name, f.phone, f.location, f.email),
+        "farmers",
+    )
+
+
+def register_workers_bulk(rows):
+    """
+    Register many workers at once, e.g. when importing an existing roster.
+
+    Rows that fail validation are reported and skipped; the rest are inserted
+    together in one transaction.
+
+    Args:
+        rows (iterable): Dicts with "name", "phone", "location", "skills" and
+            optional "available" keys. "available" accepts y/yes/1/true and
+            n/no/0/false and defaults to available.
+
+    Returns:
+        int: Number of workers registered
+    """
+    workers = [
+        (position, Worker(
+            name=_field(row, "name"),
+            phone=_field(row, "phone"),
+            location=_field(row, "location"),
+            skills=_field(row, "skills"),
+            available=_field(row, "available").lower() not in ("n", "no", "0", "false"),
+        ))
+        for position, row in _numbered(rows)
+    ]
+    return _insert_valid(
+        workers,
+        _SQL_INSERT_WORKER,
+        lambda w: (w.name, w.phone, w.location, w.skills, int(w.available)),
+        "workers",
+    )
+
+
+_BULK_REGISTER = {"farmer": register_farmers_bulk, "worker": register_workers_bulk}
+
+
+def import_users_csv(path, user_type):
+    """
+    Register every farmer or worker listed in a CSV file.
+
+    The file needs a header row naming the columns that register_farmers_bulk()
+    or register_workers_bulk() read.
+
+    Args:
+        path (str): Path to the CSV file
+        user_type (str): "farmer" or "worker"
+
+    Returns:
+        int: Number of users registered
+    """
+    register = _BULK_REGISTER.get(user_type)
+    if register is None:
+        print_error(f"Unknown user type: {user_type!r}")
+        return 0
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            return register(csv.DictReader(f))
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        print_error(f"Could not read {path}: {e}")
+        return 0
+
+
 # ------------------------------
 # Profile Viewing & Updating (DB-backed)
 # ------------------------------
 def view_farmer_profile(farmer_id: int):
     """Display a farmer profile from the database."""
-    farmer = database.fetch_one("SELECT * FROM farmers WHERE farmer_id = ?", (farmer_id,))
-    if not farmer:
+    # Positional rows: the SELECT lists exactly the displayed columns, in order
+    rows = database.fetch_all_tuples(_SQL_SELECT_FARMER, (farmer_id,))
+    if not rows:
         print_info("Farmer profile not found.")
         return
 
-    print("\n=== Farmer Profile ===")
-    for key in ("farmer_id", "name", "phone", "location", "email", "registration_date"):
-        if key in farmer:
-            print(f"{key.replace('_', ' ').title()}: {farmer[key]}")
+    lines = [f"{label}: {value}" for label, value in zip(_FARMER_PROFILE_LABELS, rows[0])]
+    sys.stdout.write("\n=== Farmer Profile ===\n" + "\n".join(lines) + "\n")
 
 
 def view_worker_profile(worker_id: int):
     """Display a worker profile from the database."""
-    worker = database.fetch_one("SELECT * FROM workers WHERE worker_id = ?", (worker_id,))
-    if not worker:
+    # Positional rows: the SELECT lists exactly the displayed columns, in order
+    rows = database.fetch_all_tuples(_SQL_SELECT_WORKER, (worker_id,))
+    if not rows:
         print_info("Worker profile not found.")
         return
 
-    print("\n=== Worker Profile ===")
-    for key in ("worker_id", "name", "phone", "location", "skills", "available", "registration_date"):
-        if key in worker:
-            print(f"{key.replace('_', ' ').title()}: {worker[key]}")
+    lines = [f"{label}: {value}" for label, value in zip(_WORKER_PROFILE_LABELS, rows[0])]
+    sys.stdout.write("\n=== Worker Profile ===\n" + "\n".join(lines) + "\n")
 
 
 def update_worker_skills(worker_id: int):
     """Prompt for and update a worker's skills in the database."""
-    worker = database.fetch_one("SELECT * FROM workers WHERE worker_id = ?", (worker_id,))
+    worker = database.fetch_one(_SQL_SELECT_WORKER_SKILLS, (worker_id,))
     if not worker:
         print_info("Worker profile not found.")
         return
@@ -139,10 +301,14 @@ def update_worker_skills(worker_id: int):
         return
 
     try:
-        database.execute_query(
-            "UPDATE workers SET skills = ? WHERE worker_id = ?",
+        updated = database.execute_query(
+            _SQL_UPDATE_WORKER_SKILLS,
             (new_skills, worker_id),
-        )
+        ).rowcount
+        # The worker can be removed while the prompt is waiting
+        if not updated:
+            print_info("Worker profile not found.")
+            return
         print_success("Worker skills updated successfully!")
     except Exception as e:
         print_error(f"Failed to update skills: {e}")
@@ -151,10 +317,14 @@ def update_worker_skills(worker_id: int):
 def update_availability(worker_id: int, available: bool):
     """Update a worker's availability flag in the database."""
     try:
-        database.execute_query(
-            "UPDATE workers SET available = ? WHERE worker_id = ?",
+        # rowcount doubles as the existence check, so no SELECT is needed first
+        updated = database.execute_query(
+            _SQL_UPDATE_WORKER_AVAILABILITY,
             (1 if available else 0, worker_id),
-        )
+        ).rowcount
+        if not updated:
+            print_info("Worker profile not found.")
+            return
         status_text = "available" if available else "not available"
         print_success(f"Availability updated: worker is now {status_text}.")
     except Exception as e:
@@ -165,6 +335,9 @@ def update_availability(worker_id: int, available: bool):
 __all__ = [
     "register_farmer",
     "register_worker",
+    "register_farmers_bulk",
+    "register_workers_bulk",
+    "import_users_csv",
     "view_farmer_profile",
     "view_worker_profile",
     "update_worker_skills",
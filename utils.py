@@ -1,22 +1,71 @@
 
 import os
+import sys
+from tabulate import tabulate
+
+
+# Tables with at least this many rows are streamed line by line instead of
+# being laid out by tabulate, which builds the whole table as one string
+STREAM_TABLE_THRESHOLD = 100
+
+
+# Cursor home + erase display. Written directly instead of spawning 'clear' or
+# 'cls' in a shell for every screen.
+_ANSI_CLEAR = "\x1b[H\x1b[2J"
+
+# Whether the terminal takes _ANSI_CLEAR; None until the first clear_screen()
+_ansi_supported = None
+
+
+def _enable_ansi():
+    """Turn on ANSI escape processing for a Windows console; True if it is available."""
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING; refused by consoles before Windows 10
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
 
 
 def clear_screen():
     
-    os.system('cls' if os.name == 'nt' else 'clear')
+    global _ansi_supported
+    # Nothing to clear when output is piped or captured
+    if not sys.stdout.isatty():
+        return
+    if _ansi_supported is None:
+        _ansi_supported = _enable_ansi()
+    if _ansi_supported:
+        sys.stdout.write(_ANSI_CLEAR)
+        sys.stdout.flush()
+    else:
+        # Legacy Windows console without escape sequence support
+        os.system('cls')
+
+
+def format_header(title):
+    """Return the banner print_header() prints, without its final newline."""
+    return f"\n{'=' * 60}\n  {title.upper()}\n{'=' * 60}\n"
 
 
 def print_header(title):
     
-    print("\n" + "=" * 60)
-    print(f"  {title.upper()}")
-    print("=" * 60 + "\n")
+    print(format_header(title))
+
+
+SEPARATOR = "-" * 60
 
 
 def print_separator():
    
-    print("-" * 60)
+    print(SEPARATOR)
 
 
 def pause():
@@ -28,31 +77,39 @@ def format_table(data, headers):
     
     if not data:
         return "No data to display."
-    col_widths = [len(str(h)) for h in headers]
-    
-    for row in data:
-        for i, item in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(item)))
-            
-    col_widths = [w + 4 for w in col_widths]
-    
-    output = []
+    # Stringify each cell once; zip() then yields whole columns for the widths
+    str_rows = [tuple(map(str, row)) for row in data]
+    # zip() would silently truncate ragged rows, so reject them up front
+    for i, row in enumerate(str_rows):
+        if len(row) != len(headers):
+            raise ValueError(f"Row {i} has {len(row)} cells, expected {len(headers)}")
+    col_widths = [max(map(len, col)) + 4 for col in zip(map(str, headers), *str_rows)]
     
     format_string = "".join([f"{{:<{w}}}" for w in col_widths])
     
     header_row = format_string.format(*headers)
-    output.append(header_row)
-    
-    separator = "-" * len(header_row)
-    output.append(separator)
-    
-    for row in data:
-        str_row = [str(item) for item in row]
-        output.append(format_string.format(*str_row))
+    output = [header_row, "-" * len(header_row)]
+    output.extend([format_string.format(*row) for row in str_rows])
 
     return "\n".join(output)
 
 
+def stream_table(rows, headers, out=None):
+    """Stream rows to out (sys.stdout by default) as tab-separated lines, never rendering a full table."""
+    out = out or sys.stdout
+    out.write("\t".join(map(str, headers)) + "\n")
+    for row in rows:
+        out.write("\t".join(map(str, row)) + "\n")
+
+
+def print_table(rows, headers, tablefmt="grid"):
+    """Print rows with tabulate, or stream them from STREAM_TABLE_THRESHOLD rows up."""
+    if len(rows) < STREAM_TABLE_THRESHOLD:
+        print(tabulate(rows, headers=headers, tablefmt=tablefmt))
+    else:
+        stream_table(rows, headers)
+
+
 def print_success(message):
    
     print(f"\n SUCCESS: {message}\n")